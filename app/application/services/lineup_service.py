@@ -3,6 +3,7 @@ Lineup service for managing NBA lineups and associating them with games.
 """
 import logging
 import unicodedata
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -16,6 +17,23 @@ from app.application.services.player_stats_service import PlayerStatsService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _normalize_player_name(name: str) -> str:
+    """
+    Normalize player name by removing accents and converting to lowercase.
+    
+    Roster and lineup names repeat across teams and refreshes, so results are
+    memoized; plain ASCII names skip the Unicode decomposition entirely.
+    """
+    if not name:
+        return ""
+    if name.isascii():
+        return name.lower().strip()
+    normalized = unicodedata.normalize('NFD', name)
+    normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+    return normalized.lower().strip()
+
+
 class LineupService:
     """
     Service for managing NBA lineups operations.
@@ -647,15 +665,6 @@ class LineupService:
         
         # Process both teams
         for team_abbr in [home_team, away_team]:
-            # Helper function to normalize player names (remove accents)
-            def normalize_player_name(name: str) -> str:
-                """Normalize player name by removing accents and converting to lowercase."""
-                if not name:
-                    return ""
-                normalized = unicodedata.normalize('NFD', name)
-                normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-                return normalized.lower().strip()
-            
             # Get all players from depth chart (NBA API rosters) for this team
             logger.debug(f"[LINEUP] Looking up roster for team {team_abbr} from database...")
             depth_chart_players = self.depth_chart_service.get_players_by_team(team_abbr)
@@ -667,7 +676,7 @@ class LineupService:
                 for nba_player in depth_chart_players:
                     player_name = nba_player.get('player_name', '')
                     if player_name:
-                        nba_players_map[normalize_player_name(player_name)] = nba_player
+                        nba_players_map[_normalize_player_name(player_name)] = nba_player
             else:
                 logger.warning(f"[LINEUP] No roster found in database for team {team_abbr}, will use FantasyNerds IDs as fallback")
                 logger.debug(f"[LINEUP] This means rosters need to be imported. Check if depth_chart_service has rosters: {self.depth_chart_service.has_depth_charts() if hasattr(self.depth_chart_service, 'has_depth_charts') else 'N/A'}")
@@ -700,7 +709,7 @@ class LineupService:
                         continue
                     
                     # Find matching player in NBA roster by name (normalized)
-                    matched_nba_player = nba_players_map.get(normalize_player_name(fantasy_player_name))
+                    matched_nba_player = nba_players_map.get(_normalize_player_name(fantasy_player_name))
                     
                     if matched_nba_player:
                         # Found match - use NBA official ID
@@ -830,15 +839,6 @@ class LineupService:
             home_team = game.get('home_team', '')
             away_team = game.get('away_team', '')
             
-            # Helper function to normalize player names (remove accents)
-            def normalize_player_name(name: str) -> str:
-                """Normalize player name by removing accents and converting to lowercase."""
-                if not name:
-                    return ""
-                normalized = unicodedata.normalize('NFD', name)
-                normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-                return normalized.lower().strip()
-            
             # Try to get NBA roster for both teams from database to map names to official IDs
             team_players_map = {}  # player_name_normalized -> nba_id
             if self.depth_chart_service:
@@ -851,7 +851,7 @@ class LineupService:
                                 player_name = nba_player.get('player_name', '')
                                 nba_id = nba_player.get('player_id')
                                 if player_name and nba_id:
-                                    team_players_map[normalize_player_name(player_name)] = nba_id
+                                    team_players_map[_normalize_player_name(player_name)] = nba_id
                     logger.info(f"[ENRICH] Loaded {len(team_players_map)} NBA player IDs from database rosters")
                 except Exception as e:
                     logger.warning(f"[ENRICH] Could not load NBA team rosters from database: {e}")
@@ -865,7 +865,7 @@ class LineupService:
                                         player_name = nba_player.get('full_name', '')
                                         nba_id = nba_player.get('id')
                                         if player_name and nba_id:
-                                            team_players_map[normalize_player_name(player_name)] = nba_id
+                                            team_players_map[_normalize_player_name(player_name)] = nba_id
                             logger.info(f"[ENRICH] Loaded {len(team_players_map)} NBA player IDs from API (fallback)")
                         except Exception as api_error:
                             logger.warning(f"[ENRICH] Could not load NBA team rosters from API either: {api_error}")
@@ -882,7 +882,7 @@ class LineupService:
                             # Try to find official NBA ID (using normalized name)
                             official_nba_id = None
                             if player_name:
-                                official_nba_id = team_players_map.get(normalize_player_name(player_name))
+                                official_nba_id = team_players_map.get(_normalize_player_name(player_name))
                                 if official_nba_id:
                                     logger.info(f"[ENRICH] Found official NBA ID {official_nba_id} for {player_name} (FantasyNerds ID: {player_id})")
                             
@@ -923,7 +923,7 @@ class LineupService:
                                 # Try to find official NBA ID (using normalized name)
                                 official_nba_id = None
                                 if player_name:
-                                    official_nba_id = team_players_map.get(normalize_player_name(player_name))
+                                    official_nba_id = team_players_map.get(_normalize_player_name(player_name))
                                     if official_nba_id:
                                         logger.info(f"[ENRICH] Found official NBA ID {official_nba_id} for BENCH player {player_name} (FantasyNerds ID: {player_id})")
                                 
@@ -17,6 +17,23 @@ from app.application.services.player_stats_service import PlayerStatsService
 
 logger = logging.getLogger(__name__)
 
+# Player prop markets requested for every game
+_PLAYER_PROP_MARKETS = "player_points,player_assists,player_rebounds"
+
+try:
+    import orjson
+
+    def _dump_payload(obj: Any) -> str:
+        """Pretty-print a payload for logging; datetimes are serialized natively."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC).decode()
+        except TypeError:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC, default=str).decode()
+except ImportError:
+    def _dump_payload(obj: Any) -> str:
+        """Pretty-print a payload for logging."""
+        return json.dumps(obj, indent=2, default=str)
+
 
 class OddsService:
     """
@@ -136,12 +153,15 @@ class OddsService:
             logger.warning(f"Error checking odds availability: {e}")
             return False
     
-    def get_player_points_odds_for_game(self, game_id: str) -> Dict[str, Any]:
+    def get_player_points_odds_for_game(self, game_id: str,
+                                        event_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get player points odds for a game and match them with lineup players.
         
         Args:
             game_id: Game identifier from our database
+            event_id: The Odds API event of the game, when the caller already
+                resolved it (default: matched from the game's teams and date)
             
         Returns:
             Dictionary with matched odds for players in the lineup
@@ -164,7 +184,8 @@ class OddsService:
                 logger.warning(f"Lineup not found for game {game_id}, but continuing to fetch odds anyway")
             
             # Find The Odds API event ID by matching teams and date
-            event_id = self._find_odds_api_event_id(game)
+            if not event_id:
+                event_id = self._find_odds_api_event_id(game)
             
             # Log the event_id that was found for this game
             if event_id:
@@ -204,7 +225,7 @@ class OddsService:
             try:
                 odds_data = self.odds_api.get_player_points_odds(
                     event_id, 
-                    markets="player_points,player_assists,player_rebounds"
+                    markets=_PLAYER_PROP_MARKETS
                 )
             except Exception as e:
                 logger.warning(f"Failed to get all player props, trying just points: {e}")
@@ -212,13 +233,22 @@ class OddsService:
             
             # Log the complete odds data received from The Odds API
             if odds_data:
-                logger.info(f"[ODDS] Game {game_id} - Event {event_id} - Complete odds response from The Odds API:")
-                logger.info(f"[ODDS] Event odds response: {json.dumps(odds_data, indent=2, default=str)}")
+                # The full payload is large; only serialize it when it is logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[ODDS] Game {game_id} - Event {event_id} - Complete odds response from The Odds API:")
+                    logger.debug("[ODDS] Event odds response: %s", _dump_payload(odds_data))
                 
                 # Also log a summary
                 bookmakers_count = len(odds_data.get('bookmakers', []))
                 if bookmakers_count > 0:
-                    fanduel = next((b for b in odds_data.get('bookmakers', []) if b.get('key', '').lower() == 'fanduel'), None)
+                    # Keys are lowercase upstream; only fall back to lower() on a mismatch
+                    fanduel = next(
+                        (
+                            b for b in odds_data.get('bookmakers', [])
+                            if b.get('key') == 'fanduel' or (b.get('key') or '').lower() == 'fanduel'
+                        ),
+                        None
+                    )
                     if fanduel:
                         player_points_market = next((m for m in fanduel.get('markets', []) if m.get('key') == 'player_points'), None)
                         if player_points_market:
@@ -1343,15 +1373,30 @@ class OddsService:
                     "players_saved": 0
                 }
             
+            # An import is an explicit refresh: don't reuse odds cached by
+            # earlier page loads
+            self.odds_api.invalidate()
+            
+            # Fetch the odds of every game in one round trip up front; the
+            # per-game lookups below are then served from the client cache
+            event_ids = [self._find_odds_api_event_id(game) for game in games]
+            try:
+                self.odds_api.get_player_points_odds_batch(
+                    [event_id for event_id in event_ids if event_id],
+                    markets=_PLAYER_PROP_MARKETS
+                )
+            except Exception as e:
+                logger.warning(f"Batch odds prefetch failed, fetching games one by one: {e}")
+            
             games_processed = 0
             total_players_saved = 0
             errors = []
             
-            for game in games:
+            for game, event_id in zip(games, event_ids):
                 game_id = game['game_id']
                 try:
                     # Get odds for this game
-                    result = self.get_player_points_odds_for_game(game_id)
+                    result = self.get_player_points_odds_for_game(game_id, event_id=event_id)
                     
                     if result.get('success') and result.get('matched_players'):
                         matched_players = result['matched_players']
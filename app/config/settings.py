@@ -31,6 +31,8 @@ class Config:
     
     # Cache settings
     CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "120"))
+    ODDS_EVENTS_CACHE_TTL_SECONDS: int = int(os.getenv("ODDS_EVENTS_CACHE_TTL_SECONDS", "30"))
+    ODDS_CACHE_TTL_SECONDS: int = int(os.getenv("ODDS_CACHE_TTL_SECONDS", "15"))
     
     # MySQL Database settings
     MYSQL_HOST: str = os.getenv("MYSQL_HOST", "mysql")
@@ -38,6 +40,9 @@ class Config:
     MYSQL_USER: str = os.getenv("MYSQL_USER", "nba_user")
     MYSQL_PASSWORD: str = os.getenv("MYSQL_PASSWORD", "nba_password")
     MYSQL_DATABASE: str = os.getenv("MYSQL_DATABASE", "nba_edge")
+    MYSQL_POOL_MIN_CACHED: int = int(os.getenv("MYSQL_POOL_MIN_CACHED", "2"))
+    MYSQL_POOL_SIZE: int = int(os.getenv("MYSQL_POOL_SIZE", "10"))
+    MYSQL_POOL_MAX_CONNECTIONS: int = int(os.getenv("MYSQL_POOL_MAX_CONNECTIONS", "20"))
     
     @property
     def mysql_connection_string(self) -> str:
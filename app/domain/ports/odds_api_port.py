@@ -43,6 +43,30 @@ class OddsAPIPort(ABC):
         """
         pass
     
+    def get_player_points_odds_batch(self, event_ids: List[str], regions: str = "us",
+                                     markets: str = "player_points",
+                                     odds_format: str = "american") -> Dict[str, Dict[str, Any]]:
+        """
+        Get player props odds for several events.
+        
+        Implementations that can fetch events in one round trip override
+        this; the default fetches them one at a time.
+        
+        Args:
+            event_ids: Event identifiers from The Odds API
+            regions: Regions to get odds from (default: "us")
+            markets: Market types (default: "player_points")
+            odds_format: Odds format (default: "american")
+            
+        Returns:
+            Dictionary mapping event_id -> odds information
+        """
+        return {
+            event_id: self.get_player_points_odds(event_id, regions, markets, odds_format)
+            for event_id in dict.fromkeys(event_ids)
+            if event_id
+        }
+    
     @abstractmethod
     def get_scores(self, sport: str = "basketball_nba", days_from: int = 1, 
                   event_ids: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -58,6 +82,16 @@ class OddsAPIPort(ABC):
             List of score dictionaries
         """
         pass
+    
+    def invalidate(self, event_id: Optional[str] = None) -> None:
+        """
+        Drop cached odds so the next call fetches fresh data.
+        
+        Implementations without a cache don't need to override this.
+        
+        Args:
+            event_id: Only drop cached odds for this event (default: odds of every event)
+        """
 
 
 
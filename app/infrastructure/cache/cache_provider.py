@@ -1,26 +1,32 @@
 """
-Cache provider (in-memory cache stub).
+Cache provider (in-memory TTL cache).
 """
+import threading
+from collections import OrderedDict
 from typing import Any, Optional
 from datetime import datetime, timedelta
 
 
 class CacheProvider:
     """
-    In-memory cache provider.
+    Thread-safe in-memory cache provider with per-entry time-to-live.
     
-    This is a stub for future implementation.
+    The cache holds at most ``maxsize`` entries: when it is full, expired
+    entries are swept first, then the least recently used ones are evicted.
     """
     
-    def __init__(self, default_ttl_seconds: int = 120):
+    def __init__(self, default_ttl_seconds: int = 120, maxsize: int = 256):
         """
         Initialize the cache provider.
         
         Args:
             default_ttl_seconds: Default time-to-live in seconds
+            maxsize: Maximum number of entries kept
         """
-        self._cache: dict = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
         self.default_ttl = default_ttl_seconds
+        self.maxsize = maxsize
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -32,15 +38,17 @@ class CacheProvider:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        if datetime.now() > entry["expires_at"]:
-            del self._cache[key]
-            return None
-        
-        return entry["value"]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            if datetime.now() > entry["expires_at"]:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return entry["value"]
     
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
         """
@@ -54,10 +62,22 @@ class CacheProvider:
         ttl = ttl_seconds or self.default_ttl
         expires_at = datetime.now() + timedelta(seconds=ttl)
         
-        self._cache[key] = {
-            "value": value,
-            "expires_at": expires_at
-        }
+        with self._lock:
+            self._cache[key] = {
+                "value": value,
+                "expires_at": expires_at
+            }
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._evict()
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones, down to maxsize."""
+        now = datetime.now()
+        for key in [k for k, entry in self._cache.items() if now > entry["expires_at"]]:
+            del self._cache[key]
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
     
     def delete(self, key: str) -> None:
         """
@@ -66,13 +86,21 @@ class CacheProvider:
         Args:
             key: Cache key
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
+    
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete all values whose key starts with the given prefix.
+        
+        Args:
+            prefix: Cache key prefix
+        """
+        with self._lock:
+            for key in [k for k in self._cache if k.startswith(prefix)]:
+                del self._cache[key]
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-
-
-
-
+        with self._lock:
+            self._cache.clear()
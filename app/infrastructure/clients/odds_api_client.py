@@ -4,12 +4,32 @@ The Odds API HTTP client.
 import json
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
 from typing import List, Dict, Any, Optional
 
 from app.domain.ports.odds_api_port import OddsAPIPort
+from app.infrastructure.cache.cache_provider import CacheProvider
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+# The sidecar lives on the internal network: fail fast when it is unreachable,
+# but keep generous read timeouts for the upstream Odds API calls it proxies.
+_CONNECT_TIMEOUT_SECONDS = 3.05
+
+_PLAYER_PROP_MARKETS_CSV = 'player_points,player_assists,player_rebounds'
+
 
 class OddsAPIClient(OddsAPIPort):
     """
@@ -17,23 +37,79 @@ class OddsAPIClient(OddsAPIPort):
     This client now calls the internal Odds API microservice instead of the external API directly.
     """
     
-    def __init__(self, service_url: str = "http://odds-api-service:8003"):
+    def __init__(self, service_url: str = "http://odds-api-service:8003",
+                 events_cache_ttl_seconds: int = 30, odds_cache_ttl_seconds: int = 15,
+                 bookmakers: Optional[str] = "fanduel"):
         """
         Initialize the client.
         
         Args:
             service_url: Base URL for the Odds API microservice
+            events_cache_ttl_seconds: How long fetched events are reused (default: 30)
+            odds_cache_ttl_seconds: How long fetched event odds are reused (default: 15)
+            bookmakers: Bookmaker keys the microservice should return odds for (default: "fanduel")
         """
         self.service_url = service_url.rstrip('/')
+        self.bookmakers = bookmakers
+        self._session = self._create_session()
+        self._cache = CacheProvider()
+        self.events_cache_ttl_seconds = events_cache_ttl_seconds
+        self.odds_cache_ttl_seconds = odds_cache_ttl_seconds
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled keep-alive session shared by all requests of this client."""
+        session = requests.Session()
+        # ACCEPT_ENCODING only advertises br/zstd when their decoders are installed
+        session.headers.update({'Accept': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                status=3,
+                backoff_factor=0.4,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                respect_retry_after_header=True,
+                # Hand the final error response back so raise_for_status() reports it
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def invalidate(self, event_id: Optional[str] = None) -> None:
+        """
+        Drop cached odds so the next call hits the microservice.
+        
+        Cached events are kept: event ids don't change, and the list
+        expires on its own TTL.
+        
+        Args:
+            event_id: Only drop cached odds for this event (default: odds of every event)
+        """
+        if event_id is None:
+            self._cache.delete_prefix("odds:")
+        else:
+            self._cache.delete_prefix(f"odds:{event_id}:")
+
+    @staticmethod
+    def _odds_cache_key(event_id: str, regions: str, markets: str, odds_format: str) -> str:
+        return f"odds:{event_id}:{regions}:{markets}:{odds_format}"
 
     @staticmethod
     def _log_request(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> None:
-        try:
-            req = requests.Request(method=method, url=url, params=params)
-            prepared = req.prepare()
-            logger.info(f"[ODDS API SERVICE] RAW REQUEST: {prepared.method} {prepared.url}")
-        except Exception as e:
-            logger.warning(f"[ODDS API SERVICE] Could not format request URL: {e}")
+        if logger.isEnabledFor(logging.INFO):
+            query = urlencode(params or {})
+            logger.info("[ODDS API SERVICE] RAW REQUEST: %s %s%s", method, url, f"?{query}" if query else "")
     
     def get_events_for_sport(self, sport: str = "basketball_nba") -> List[Dict[str, Any]]:
         """
@@ -45,31 +121,39 @@ class OddsAPIClient(OddsAPIPort):
         Returns:
             List of event dictionaries
         """
+        cache_key = f"events:{sport}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.service_url}/api/v1/events"
             params = {'sport': sport}
             
-            logger.info(f"[ODDS API SERVICE] REQUEST: Fetching events for sport: {sport}")
+            logger.info("[ODDS API SERVICE] REQUEST: Fetching events for sport: %s", sport)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=(_CONNECT_TIMEOUT_SECONDS, 10))
             response.raise_for_status()
             
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
-                logger.info(f"[ODDS API SERVICE] RESPONSE: Successfully fetched events")
-                return result.get('events', [])
+                logger.info("[ODDS API SERVICE] RESPONSE: Successfully fetched events")
+                events = result.get('events', [])
+                if events:
+                    self._cache.set(cache_key, events, self.events_cache_ttl_seconds)
+                return events
             else:
-                logger.error(f"[ODDS API SERVICE] RESPONSE ERROR: {result.get('error')}")
+                logger.error("[ODDS API SERVICE] RESPONSE ERROR: %s", result.get('error'))
                 return []
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API SERVICE] REQUEST ERROR: Error fetching events: {e}")
+            logger.error("[ODDS API SERVICE] REQUEST ERROR: Error fetching events: %s", e)
             return []
         except Exception as e:
-            logger.error(f"[ODDS API SERVICE] ERROR: Unexpected error: {e}")
+            logger.error("[ODDS API SERVICE] ERROR: Unexpected error: %s", e)
             return []
     
     def get_player_points_odds(self, event_id: str, regions: str = "us", 
-                              markets: str = "player_points,player_assists,player_rebounds", 
+                              markets: str = _PLAYER_PROP_MARKETS_CSV, 
                               odds_format: str = "american") -> Dict[str, Any]:
         """
         Get player props odds for a specific event (points, assists, rebounds).
@@ -88,6 +172,11 @@ class OddsAPIClient(OddsAPIPort):
         Returns:
             Dictionary with odds information (only FanDuel bookmaker)
         """
+        cache_key = self._odds_cache_key(event_id, regions, markets, odds_format)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.service_url}/api/v1/events/{event_id}/odds"
             params = {
@@ -95,26 +184,100 @@ class OddsAPIClient(OddsAPIPort):
                 'markets': markets,
                 'odds_format': odds_format
             }
+            if self.bookmakers:
+                params['bookmakers'] = self.bookmakers
             
-            logger.info(f"[ODDS API SERVICE] REQUEST: Fetching player props odds for event {event_id}")
+            logger.info("[ODDS API SERVICE] REQUEST: Fetching player props odds for event %s", event_id)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=30)
+            response = self._session.get(url, params=params, timeout=(_CONNECT_TIMEOUT_SECONDS, 30))
             response.raise_for_status()
             
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
-                logger.info(f"[ODDS API SERVICE] RESPONSE: Successfully fetched odds")
-                return result.get('data', {})
+                logger.info("[ODDS API SERVICE] RESPONSE: Successfully fetched odds")
+                odds = result.get('data', {})
+                if odds:
+                    self._cache.set(cache_key, odds, self.odds_cache_ttl_seconds)
+                return odds
             else:
-                logger.error(f"[ODDS API SERVICE] RESPONSE ERROR: {result.get('error')}")
+                logger.error("[ODDS API SERVICE] RESPONSE ERROR: %s", result.get('error'))
                 return {}
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API SERVICE] REQUEST ERROR: Error fetching odds: {e}")
+            logger.error("[ODDS API SERVICE] REQUEST ERROR: Error fetching odds: %s", e)
             return {}
         except Exception as e:
-            logger.error(f"[ODDS API SERVICE] ERROR: Unexpected error: {e}")
+            logger.error("[ODDS API SERVICE] ERROR: Unexpected error: %s", e)
             return {}
     
+    def get_player_points_odds_batch(self, event_ids: List[str], regions: str = "us",
+                                     markets: str = _PLAYER_PROP_MARKETS_CSV,
+                                     odds_format: str = "american") -> Dict[str, Dict[str, Any]]:
+        """
+        Get player props odds for several events in a single round trip.
+        
+        Cached events are served locally; the rest are fetched through the
+        microservice batch endpoint, which fans out to The Odds API concurrently.
+        
+        Args:
+            event_ids: Event identifiers from The Odds API
+            regions: Regions to get odds from (default: "us")
+            markets: Market types (default: "player_points,player_assists,player_rebounds")
+            odds_format: Odds format (default: "american")
+            
+        Returns:
+            Dictionary mapping event_id -> odds information (empty dict on failure)
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for event_id in dict.fromkeys(event_id for event_id in event_ids if event_id):
+            cached = self._cache.get(self._odds_cache_key(event_id, regions, markets, odds_format))
+            if cached is not None:
+                results[event_id] = cached
+            else:
+                missing.append(event_id)
+        
+        if not missing:
+            return results
+        
+        data = {}
+        try:
+            url = f"{self.service_url}/api/v1/events/odds/batch"
+            payload = {
+                'event_ids': missing,
+                'regions': regions,
+                'markets': markets,
+                'odds_format': odds_format
+            }
+            if self.bookmakers:
+                payload['bookmakers'] = self.bookmakers
+            
+            logger.info("[ODDS API SERVICE] REQUEST: Fetching player props odds for %d events", len(missing))
+            self._log_request("POST", url)
+            response = self._session.post(url, json=payload, timeout=(_CONNECT_TIMEOUT_SECONDS, 60))
+            response.raise_for_status()
+            
+            result = _loads(response.content)
+            if result.get('success'):
+                logger.info("[ODDS API SERVICE] RESPONSE: Successfully fetched batch odds")
+                data = result.get('data', {})
+            else:
+                logger.error("[ODDS API SERVICE] RESPONSE ERROR: %s", result.get('error'))
+        except requests.exceptions.RequestException as e:
+            logger.error("[ODDS API SERVICE] REQUEST ERROR: Error fetching batch odds: %s", e)
+        except Exception as e:
+            logger.error("[ODDS API SERVICE] ERROR: Unexpected error: %s", e)
+        
+        for event_id in missing:
+            odds = data.get(event_id) or {}
+            if odds:
+                self._cache.set(
+                    self._odds_cache_key(event_id, regions, markets, odds_format),
+                    odds,
+                    self.odds_cache_ttl_seconds
+                )
+            results[event_id] = odds
+        return results
+    
     def get_scores(self, sport: str = "basketball_nba", days_from: int = 1, 
                   event_ids: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -138,22 +301,22 @@ class OddsAPIClient(OddsAPIPort):
             if event_ids:
                 params['event_ids'] = event_ids
             
-            logger.info(f"[ODDS API SERVICE] REQUEST: Fetching scores for sport: {sport}")
+            logger.info("[ODDS API SERVICE] REQUEST: Fetching scores for sport: %s", sport)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=(_CONNECT_TIMEOUT_SECONDS, 10))
             response.raise_for_status()
             
-            result = response.json()
+            result = _loads(response.content)
             if result.get('success'):
-                logger.info(f"[ODDS API SERVICE] RESPONSE: Successfully fetched scores")
+                logger.info("[ODDS API SERVICE] RESPONSE: Successfully fetched scores")
                 return result.get('scores', [])
             else:
-                logger.error(f"[ODDS API SERVICE] RESPONSE ERROR: {result.get('error')}")
+                logger.error("[ODDS API SERVICE] RESPONSE ERROR: %s", result.get('error'))
                 return []
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API SERVICE] REQUEST ERROR: Error fetching scores: {e}")
+            logger.error("[ODDS API SERVICE] REQUEST ERROR: Error fetching scores: %s", e)
             return []
         except Exception as e:
-            logger.error(f"[ODDS API SERVICE] ERROR: Unexpected error: {e}")
+            logger.error("[ODDS API SERVICE] ERROR: Unexpected error: %s", e)
             return []
 
@@ -1,53 +1,51 @@
 """
 MySQL database connection manager.
 """
-import pymysql
-from typing import Optional
+from dbutils.pooled_db import PooledDedicatedDBConnection
 
 from app.config.settings import Config
+from app.infrastructure.database.pool import get_pool
 
 
 class DatabaseConnection:
     """
-    Manages MySQL database connections.
+    Manages MySQL database connections through a connection pool.
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, multi_statements: bool = False):
         """
-        Initialize database connection.
+        Initialize the connection manager.
+        
+        Connections come from a pool shared by every instance pointing at
+        the same database, so creating a DatabaseConnection is cheap.
         
         Args:
             config: Application configuration
+            multi_statements: Allow several ``;``-separated statements per
+                execute call (only used for schema scripts)
         """
         self.config = config
-        self._connection: Optional[pymysql.Connection] = None
+        self._multi_statements = multi_statements
+        self._connection = None
     
-    def get_connection(self) -> pymysql.Connection:
+    def get_connection(self) -> PooledDedicatedDBConnection:
         """
-        Get or create a database connection.
+        Check out a database connection from the pool.
+        
+        Closing the returned connection (or leaving its ``with`` block)
+        hands it back to the pool instead of tearing down the socket.
         
         Returns:
-            MySQL connection object
+            Pooled MySQL connection object
         """
-        # Always create a fresh connection to avoid cross-request reuse
-        self._connection = pymysql.connect(
-            host=self.config.MYSQL_HOST,
-            port=self.config.MYSQL_PORT,
-            user=self.config.MYSQL_USER,
-            password=self.config.MYSQL_PASSWORD,
-            database=self.config.MYSQL_DATABASE,
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor,
-            autocommit=False
-        )
+        self._connection = get_pool(self.config, self._multi_statements).connection()
         return self._connection
     
     def close(self) -> None:
-        """Close the database connection."""
+        """Return the current connection to the pool."""
         if self._connection:
             try:
-                if self._connection.open:
-                    self._connection.close()
+                self._connection.close()
             finally:
                 self._connection = None
     
@@ -57,13 +55,12 @@ class DatabaseConnection:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if exc_type is None:
-            self._connection.commit()
-        else:
-            self._connection.rollback()
-        # Don't close connection, just commit/rollback
+        try:
+            if exc_type is None:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        finally:
+            # Hand the connection back to the pool so none outlives the block
+            self.close()
         return False
-
-
-
-
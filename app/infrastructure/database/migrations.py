@@ -1,333 +1,817 @@
 """
 Database migration and initialization scripts.
 """
+import hashlib
 import logging
+import re
+import pymysql
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Set
 from app.config.settings import Config
 from app.infrastructure.database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+# Create games table
+_CREATE_GAMES = """
+    CREATE TABLE IF NOT EXISTS games (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        game_id VARCHAR(50) UNIQUE NOT NULL,
+        home_team CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL,
+        away_team CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL,
+        game_date DATE NOT NULL,
+        game_time TIME,
+        status VARCHAR(20),
+        season VARCHAR(10),
+        season_type VARCHAR(20),
+        home_team_name VARCHAR(100),
+        away_team_name VARCHAR(100),
+        home_team_logo_url VARCHAR(255),
+        away_team_logo_url VARCHAR(255),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# Create game_lineups table
+_CREATE_LINEUPS = """
+    CREATE TABLE IF NOT EXISTS game_lineups (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        game_id VARCHAR(50) NOT NULL,
+        lineup_date DATE NOT NULL,
+        team_abbr CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL,
+        position VARCHAR(50) NOT NULL,
+        player_id INT NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        player_photo_url VARCHAR(255),
+        confirmed TINYINT(1) DEFAULT 0,
+        player_status VARCHAR(10) DEFAULT 'BENCH',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_lineup (game_id, team_abbr, position, lineup_date),
+        FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# Create lineup_odds table: current odds lines for a lineup row, kept out of
+# game_lineups since most lineup rows never get odds
+_CREATE_LINEUP_ODDS = """
+    CREATE TABLE IF NOT EXISTS lineup_odds (
+        lineup_id INT PRIMARY KEY,
+        points_line DECIMAL(5,1) NULL,
+        assists_line DECIMAL(5,1) NULL,
+        rebounds_line DECIMAL(5,1) NULL,
+        over_under_history JSON NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (lineup_id) REFERENCES game_lineups(id) ON DELETE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# Create team_depth_charts table
+_CREATE_DEPTH_CHARTS = """
+    CREATE TABLE IF NOT EXISTS team_depth_charts (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        team_abbr CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL,
+        season INT NOT NULL,
+        position VARCHAR(5) NOT NULL,
+        depth INT NOT NULL,
+        player_id INT NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        player_photo_url VARCHAR(255),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_depth_chart (team_abbr, season, position, depth, player_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# Create player_game_logs table for storing game logs locally
+_CREATE_GAME_LOGS = """
+    CREATE TABLE IF NOT EXISTS player_game_logs (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        player_id INT NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        game_date DATE NOT NULL,
+        matchup VARCHAR(50),
+        points TINYINT UNSIGNED,
+        minutes_played DECIMAL(4,1),
+        start_position VARCHAR(5) NULL,
+        starter_status VARCHAR(10) NULL,
+        field_goals_made TINYINT UNSIGNED,
+        field_goals_attempted TINYINT UNSIGNED,
+        three_pointers_made TINYINT UNSIGNED,
+        three_pointers_attempted TINYINT UNSIGNED,
+        free_throws_made TINYINT UNSIGNED,
+        free_throws_attempted TINYINT UNSIGNED,
+        rebounds TINYINT UNSIGNED,
+        assists TINYINT UNSIGNED,
+        steals TINYINT UNSIGNED,
+        blocks TINYINT UNSIGNED,
+        turnovers TINYINT UNSIGNED,
+        personal_fouls TINYINT UNSIGNED,
+        plus_minus SMALLINT,
+        game_data JSON,
+        game_data_hash BIGINT UNSIGNED NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_game_log (player_id, game_date, matchup)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# Create player_odds_history table for storing odds history. It is an
+# append-only time series, partitioned by month of recorded_at so old months
+# can be dropped cheaply and range scans prune to the months they touch;
+# monthly partitions are carved out of pmax by extend_odds_partitions()
+_CREATE_ODDS_HISTORY = """
+    CREATE TABLE IF NOT EXISTS player_odds_history (
+        id INT AUTO_INCREMENT,
+        player_id INT NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        game_id VARCHAR(50) NOT NULL,
+        game_date DATE NOT NULL,
+        team_abbr CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL,
+        points_line DECIMAL(5,1) NOT NULL,
+        assists_line DECIMAL(5,1) NULL,
+        rebounds_line DECIMAL(5,1) NULL,
+        over_odds INT,
+        under_odds INT,
+        bookmaker VARCHAR(50),
+        recorded_at DATETIME NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id, recorded_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    PARTITION BY RANGE (TO_DAYS(recorded_at)) (
+        PARTITION pmax VALUES LESS THAN MAXVALUE
+    )
+"""
+
+# Records which schema revision has been applied to the database
+_CREATE_SCHEMA_VERSION = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version VARCHAR(64) PRIMARY KEY,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# All CREATE TABLE statements, sent to the server in one round trip
+_CREATE_TABLES_SCRIPT = ";\n".join([
+    _CREATE_GAMES,
+    _CREATE_LINEUPS,
+    _CREATE_LINEUP_ODDS,
+    _CREATE_DEPTH_CHARTS,
+    _CREATE_GAME_LOGS,
+    _CREATE_ODDS_HISTORY,
+    _CREATE_SCHEMA_VERSION,
+])
+
+# Columns introduced after their table was first created, added to existing
+# databases when missing: (table, column, definition)
+_ADDED_COLUMNS = (
+    ('games', 'home_team_logo_url', "VARCHAR(255)"),
+    ('games', 'away_team_logo_url', "VARCHAR(255)"),
+    ('games', 'home_score', "INT NULL"),
+    ('games', 'away_score', "INT NULL"),
+    ('games', 'score_last_update', "DATETIME NULL"),
+    ('games', 'game_completed', "TINYINT(1) DEFAULT 0"),
+    ('game_lineups', 'player_photo_url', "VARCHAR(255)"),
+    ('game_lineups', 'player_status', "VARCHAR(10) DEFAULT 'BENCH'"),
+    ('player_game_logs', 'start_position', "VARCHAR(5) NULL"),
+    ('player_game_logs', 'starter_status', "VARCHAR(10) NULL"),
+    ('player_game_logs', 'game_data_hash', "BIGINT UNSIGNED NULL"),
+    ('player_odds_history', 'assists_line', "DECIMAL(5,1) NULL"),
+    ('player_odds_history', 'rebounds_line', "DECIMAL(5,1) NULL"),
+)
+
+# Non-unique secondary indexes, kept out of the CREATE TABLE statements so
+# bulk loads into fresh tables can defer them: (table, index, columns)
+_SECONDARY_INDEXES = (
+    # Returns a day's games already in game_time order (no filesort)
+    ('games', 'idx_game_date_time', 'game_date, game_time'),
+    ('games', 'idx_game_id', 'game_id'),
+    ('games', 'idx_status', 'status'),
+    ('game_lineups', 'idx_game_id', 'game_id'),
+    # Also serves name lookups: player_name compares case- and
+    # accent-insensitively under utf8mb4_unicode_ci
+    ('game_lineups', 'idx_lineup_date_name', 'lineup_date, player_name'),
+    ('game_lineups', 'idx_team_abbr', 'team_abbr'),
+    ('team_depth_charts', 'idx_team_abbr', 'team_abbr'),
+    ('team_depth_charts', 'idx_season', 'season'),
+    ('team_depth_charts', 'idx_player_name', 'player_name'),
+    ('player_game_logs', 'idx_game_date', 'game_date'),
+    # Matches the "latest games for a player" order used by reads and cleanup
+    ('player_game_logs', 'idx_player_date_id', 'player_id, game_date DESC, id DESC'),
+    # Same order for name lookups (case-insensitive through the collation)
+    ('player_game_logs', 'idx_player_name_date', 'player_name, game_date DESC, id DESC'),
+    ('player_odds_history', 'idx_game_id', 'game_id'),
+    ('player_odds_history', 'idx_game_date', 'game_date'),
+    ('player_odds_history', 'idx_recorded_at', 'recorded_at'),
+    # Covers "latest odds for a player in a game" without touching the rows
+    ('player_odds_history', 'idx_player_game_rec',
+     'player_id, game_id, recorded_at DESC, points_line, assists_line, '
+     'rebounds_line, over_odds, under_odds'),
+)
+
+# Indexes superseded by the ones above, dropped from existing databases:
+# (table, index)
+_DROPPED_INDEXES = (
+    ('player_odds_history', 'idx_player_id'),    # prefix of idx_player_game_rec
+    ('player_odds_history', 'idx_player_game'),  # replaced by idx_player_game_rec
+    ('player_game_logs', 'idx_player_id'),       # prefix of idx_player_date_id
+    ('player_game_logs', 'idx_player_date'),     # replaced by idx_player_date_id
+    ('game_lineups', 'idx_lineup_date'),         # prefix of idx_lineup_date_name
+    ('games', 'idx_game_date'),                  # prefix of idx_game_date_time
+)
+
+# Columns whose type was narrowed after their table was first created;
+# existing databases are converted in place: (table, column, definition).
+# Box scores fit in TINYINT/SMALLINT, and team abbreviations are always three
+# ASCII letters (case-insensitive collation, as before)
+_TEAM_ABBR_DEFINITION = "CHAR(3) CHARACTER SET ascii COLLATE ascii_general_ci NOT NULL"
+_RETYPED_COLUMNS = (
+    ('player_game_logs', 'points', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'minutes_played', "DECIMAL(4,1)"),
+    ('player_game_logs', 'field_goals_made', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'field_goals_attempted', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'three_pointers_made', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'three_pointers_attempted', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'free_throws_made', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'free_throws_attempted', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'rebounds', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'assists', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'steals', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'blocks', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'turnovers', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'personal_fouls', "TINYINT UNSIGNED"),
+    ('player_game_logs', 'plus_minus', "SMALLINT"),
+    ('games', 'home_team', _TEAM_ABBR_DEFINITION),
+    ('games', 'away_team', _TEAM_ABBR_DEFINITION),
+    ('game_lineups', 'team_abbr', _TEAM_ABBR_DEFINITION),
+    ('team_depth_charts', 'team_abbr', _TEAM_ABBR_DEFINITION),
+    ('player_odds_history', 'team_abbr', _TEAM_ABBR_DEFINITION),
+)
+
+# Tables that receive incremental ADD COLUMN migrations / secondary indexes
+_MIGRATED_TABLES = tuple(dict.fromkeys(table for table, _, _ in _ADDED_COLUMNS + _RETYPED_COLUMNS))
+_INDEXED_TABLES = tuple(dict.fromkeys(table for table, _, _ in _SECONDARY_INDEXES))
+
+# ALTER clauses/statements rendered once at import: (table, name, sql)
+_ADD_COLUMN_CLAUSES = tuple(
+    (table, column, f"ADD COLUMN {column} {definition}")
+    for table, column, definition in _ADDED_COLUMNS
+)
+_ADD_INDEX_CLAUSES = tuple(
+    (table, index, f"ADD INDEX {index} ({columns})")
+    for table, index, columns in _SECONDARY_INDEXES
+)
+
+# Odds columns that older databases still carry on game_lineups; they are
+# moved into lineup_odds and then dropped
+_LINEUP_ODDS_COLUMNS = ('points_line', 'assists_line', 'rebounds_line', 'over_under_history')
+
+# Widens position on databases created while it was VARCHAR(5)
+_RESIZE_POSITION = """
+    ALTER TABLE game_lineups
+    MODIFY COLUMN position VARCHAR(50) NOT NULL
+"""
+
+# Converts an unpartitioned player_odds_history (created before partitioning)
+# to the layout of _CREATE_ODDS_HISTORY; the partition key must be part of
+# the primary key
+_PARTITION_ODDS_HISTORY = """
+    ALTER TABLE player_odds_history
+    DROP PRIMARY KEY, ADD PRIMARY KEY (id, recorded_at)
+    PARTITION BY RANGE (TO_DAYS(recorded_at)) (
+        PARTITION pmax VALUES LESS THAN MAXVALUE
+    )
+"""
+
+# Fingerprint of the DDL above; a database stamped with this version already
+# has every table and column, so create_tables can skip the whole migration
+_SCHEMA_VERSION = hashlib.sha256(
+    "\n".join([
+        _CREATE_TABLES_SCRIPT,
+        repr(_ADDED_COLUMNS),
+        _RESIZE_POSITION,
+        repr(_SECONDARY_INDEXES),
+        repr(_DROPPED_INDEXES),
+        repr(_LINEUP_ODDS_COLUMNS),
+        repr(_RETYPED_COLUMNS),
+        _PARTITION_ODDS_HISTORY,
+    ]).encode()
+).hexdigest()[:16]
+
+# Online DDL hints: additive nullable columns are metadata-only changes on
+# MySQL 8.0.12+ (INSTANT only accepts the default LOCK), as are column drops
+# on 8.0.29+, and widening a
+# VARCHAR can be done in place without rebuilding the table
+_ADD_COLUMN_HINTS = "ALGORITHM=INSTANT"
+_DROP_COLUMN_HINTS = "ALGORITHM=INSTANT"
+_MODIFY_COLUMN_HINTS = "ALGORITHM=INPLACE, LOCK=SHARED"
+_INDEX_HINTS = "ALGORITHM=INPLACE, LOCK=NONE"
+# Narrowing a column or changing its charset always copies the table; keep
+# reads going
+_RETYPE_COLUMN_HINTS = "ALGORITHM=COPY, LOCK=SHARED"
+
+# Errors a server raises for DDL hints it doesn't support; only these make
+# _alter_table retry without hints: ER_PARSE_ERROR (INSTANT on servers
+# that predate it), ER_UNKNOWN_ALTER_ALGORITHM, ER_UNKNOWN_ALTER_LOCK,
+# ER_ALTER_OPERATION_NOT_SUPPORTED and ER_ALTER_OPERATION_NOT_SUPPORTED_REASON
+_UNSUPPORTED_HINT_ERRORS = frozenset((1064, 1800, 1801, 1845, 1846))
+
+# Introspection and bookkeeping queries (PyMySQL expands a tuple argument
+# into a parenthesised IN list)
+_SELECT_COLUMNS = """
+    SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+           COLUMN_TYPE AS column_type
+    FROM information_schema.columns
+    WHERE table_schema = DATABASE()
+    AND table_name IN %s
+"""
+_SELECT_INDEXES = """
+    SELECT DISTINCT TABLE_NAME AS table_name, INDEX_NAME AS index_name
+    FROM information_schema.statistics
+    WHERE table_schema = DATABASE()
+    AND table_name IN %s
+"""
+_SELECT_ODDS_PARTITIONS = """
+    SELECT PARTITION_NAME AS partition_name
+    FROM information_schema.partitions
+    WHERE table_schema = DATABASE()
+    AND table_name = 'player_odds_history'
+"""
+# Session settings for the migration: FK validation adds a lookup per
+# copied/backfilled row and is not needed while the schema itself is being
+# built. Unique checks stay on so rebuilt tables can't take in duplicate keys
+_DISABLE_CHECKS = "SET SESSION foreign_key_checks = 0;\n"
+_RESTORE_CHECKS = "SET SESSION foreign_key_checks = 1"
+
+_SELECT_SCHEMA_VERSION = "SELECT 1 FROM schema_version WHERE version = %s"
+_INSERT_SCHEMA_VERSION = "INSERT IGNORE INTO schema_version (version) VALUES (%s)"
+
+# Databases whose schema has already been verified by this process. The schema
+# does not change while a worker is running, so repeated calls are no-ops.
+_SCHEMA_CHECKED: Set[str] = set()
+
+
+def _schema_key(config: Config) -> str:
+    """Identify the target database for the schema-checked cache."""
+    return f"{config.MYSQL_HOST}:{config.MYSQL_PORT}/{config.MYSQL_DATABASE}"
+
+
+def _is_schema_current(cursor) -> bool:
+    """
+    Check whether the database is already stamped with _SCHEMA_VERSION.
+    
+    Args:
+        cursor: Open database cursor
+    
+    Returns:
+        True if the current schema version has been applied
+    """
+    try:
+        cursor.execute(_SELECT_SCHEMA_VERSION, (_SCHEMA_VERSION,))
+    except pymysql.err.ProgrammingError:
+        # schema_version doesn't exist yet (fresh database)
+        return False
+    return cursor.fetchone() is not None
+
+
+def _existing_columns(cursor, tables: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch the current columns of the given tables in a single query.
+    
+    Tables the information_schema lookup can't see (e.g. when the database
+    user lacks privileges on it, or the query itself is rejected) are
+    probed individually with SHOW COLUMNS, which is served from the table
+    definition cache.
+    
+    Args:
+        cursor: Open database cursor
+        tables: Table names to inspect
+    
+    Returns:
+        Mapping of table name to ``{column_name: column_type}``
+    """
+    tables = tuple(tables)
+    columns: Dict[str, Dict[str, str]] = {table: {} for table in tables}
+    
+    try:
+        cursor.execute(_SELECT_COLUMNS, (tables,))
+        for row in cursor.fetchall():
+            columns.setdefault(row['table_name'], {})[row['column_name'].lower()] = str(row['column_type']).lower()
+    except pymysql.MySQLError as e:
+        logger.debug(f"information_schema column lookup failed, using SHOW COLUMNS: {e}")
+    
+    for table in tables:
+        if not columns[table]:
+            columns[table] = _show_columns(cursor, table)
+    return columns
+
+
+def _show_columns(cursor, table: str) -> Dict[str, str]:
+    """
+    Fetch the columns of a single table with SHOW COLUMNS.
+    
+    Args:
+        cursor: Open database cursor
+        table: Table name (one of the schema's own tables, never user input)
+    
+    Returns:
+        Mapping of column name to column type
+    """
+    cursor.execute(f"SHOW COLUMNS FROM `{table}`")
+    return {row['Field'].lower(): str(row['Type']).lower() for row in cursor.fetchall()}
 
-def create_tables(config: Config) -> None:
+
+def _existing_indexes(cursor, tables: Iterable[str]) -> Dict[str, Set[str]]:
+    """
+    Fetch the index names of the given tables in a single query.
+    
+    Args:
+        cursor: Open database cursor
+        tables: Table names to inspect
+    
+    Returns:
+        Mapping of table name to its set of index names
+    """
+    tables = tuple(tables)
+    cursor.execute(_SELECT_INDEXES, (tables,))
+    
+    indexes: Dict[str, Set[str]] = {table: set() for table in tables}
+    for row in cursor.fetchall():
+        indexes.setdefault(row['table_name'], set()).add(row['index_name'].lower())
+    return indexes
+
+
+def _alter_table(cursor, statement: str, hints: str) -> None:
+    """
+    Run an ALTER TABLE statement, preferring the given online DDL hints.
+    
+    Servers that don't support the requested algorithm (e.g. MySQL 5.7 and
+    ALGORITHM=INSTANT) reject the hinted statement, in which case it is
+    retried without hints so the server picks its default algorithm. Any
+    other error (out-of-range data, lock wait timeout, duplicate key) is
+    raised right away instead of running the ALTER a second time.
+    
+    Args:
+        cursor: Open database cursor
+        statement: ALTER TABLE statement without algorithm clauses
+        hints: Clauses appended to the statement, e.g. ``ALGORITHM=INSTANT``
+    """
+    try:
+        cursor.execute(f"{statement.rstrip()}, {hints}")
+    except pymysql.MySQLError as e:
+        if not e.args or e.args[0] not in _UNSUPPORTED_HINT_ERRORS:
+            raise
+        logger.debug(f"ALTER with '{hints}' not supported, retrying without hints: {e}")
+        cursor.execute(statement)
+
+
+def _move_lineup_odds(cursor, lineup_columns: Dict[str, str]) -> None:
+    """
+    Move odds lines still stored on game_lineups into lineup_odds.
+    
+    Rows that carry any odds value are copied (existing lineup_odds rows
+    win), then the legacy columns are dropped from game_lineups.
+    
+    Args:
+        cursor: Open database cursor
+        lineup_columns: Current game_lineups columns
+    """
+    legacy = [column for column in _LINEUP_ODDS_COLUMNS if column in lineup_columns]
+    if not legacy:
+        return
+    
+    select_list = ", ".join(column if column in legacy else "NULL" for column in _LINEUP_ODDS_COLUMNS)
+    has_odds = " OR ".join(f"{column} IS NOT NULL" for column in legacy)
+    cursor.execute(f"""
+        INSERT IGNORE INTO lineup_odds (lineup_id, {", ".join(_LINEUP_ODDS_COLUMNS)})
+        SELECT id, {select_list}
+        FROM game_lineups
+        WHERE {has_odds}
+    """)
+    logger.info(f"Moved odds lines of {cursor.rowcount} lineup row(s) to lineup_odds")
+    
+    drops = ", ".join(f"DROP COLUMN {column}" for column in legacy)
+    _alter_table(cursor, f"ALTER TABLE game_lineups {drops}", _DROP_COLUMN_HINTS)
+    logger.info(f"Dropped {', '.join(legacy)} from game_lineups")
+
+
+def _pending_retypes(columns: Dict[str, Dict[str, str]]) -> Dict[str, List[str]]:
+    """
+    Find the columns that don't have their _RETYPED_COLUMNS type yet.
+    
+    Args:
+        columns: Current columns per table, as returned by _existing_columns
+    
+    Returns:
+        MODIFY COLUMN clauses per table, for the tables with pending conversions
+    """
+    modifies: Dict[str, List[str]] = {}
+    for table, column, definition in _RETYPED_COLUMNS:
+        current = columns[table].get(column)
+        if current is None:
+            continue
+        # Compare the bare type, ignoring integer display widths reported by
+        # MySQL 5.7 (e.g. tinyint(3)) and the charset/NULL attributes
+        target = re.split(r' (?:CHARACTER SET|NOT NULL)', definition)[0].lower()
+        if re.sub(r'int\(\d+\)', 'int', current) != target:
+            modifies.setdefault(table, []).append(f"MODIFY COLUMN {column} {definition}")
+    return modifies
+
+
+def _retype_columns(cursor, columns: Dict[str, Dict[str, str]]) -> bool:
+    """
+    Convert columns to the types in _RETYPED_COLUMNS.
+    
+    All conversions of a table are applied in a single ALTER. If existing
+    data doesn't fit the narrower types the ALTER is rejected and that
+    table keeps its old types.
+    
+    Args:
+        cursor: Open database cursor
+        columns: Current columns per table, as returned by _existing_columns
+    
+    Returns:
+        True if every table has its compact types, False if a conversion failed
+    """
+    converted = True
+    for table, clauses in _pending_retypes(columns).items():
+        try:
+            _alter_table(cursor, f"ALTER TABLE {table} {', '.join(clauses)}", _RETYPE_COLUMN_HINTS)
+            logger.info(f"Converted {len(clauses)} {table} column(s) to compact types")
+        except pymysql.MySQLError as e:
+            logger.warning(f"Could not convert {table} columns to compact types: {e}")
+            converted = False
+    return converted
+
+
+def _odds_partitions(cursor) -> Set[str]:
+    """
+    Get the partition names of player_odds_history.
+    
+    Args:
+        cursor: Open database cursor
+    
+    Returns:
+        Partition names; empty if the table is not partitioned
+    """
+    cursor.execute(_SELECT_ODDS_PARTITIONS)
+    return {row['partition_name'] for row in cursor.fetchall() if row['partition_name']}
+
+
+def _add_month(month: date) -> date:
+    """Return the first day of the month after ``month``."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _extend_odds_partitions(cursor, months_ahead: int = 1) -> None:
+    """
+    Split monthly partitions off pmax up to ``months_ahead`` months from now.
+    
+    Months are added after the newest existing monthly partition (or, on a
+    table without any, starting at the oldest recorded odds) so partition
+    bounds stay strictly increasing.
+    
+    Args:
+        cursor: Open database cursor
+        months_ahead: How many future months should already have a partition
+    """
+    partitions = _odds_partitions(cursor)
+    if 'pmax' not in partitions:
+        return
+    
+    monthly = sorted(name for name in partitions if name != 'pmax')
+    if monthly:
+        last = datetime.strptime(monthly[-1], 'p%Y%m').date()
+        month = _add_month(last)
+    else:
+        cursor.execute("SELECT MIN(recorded_at) AS first_recorded FROM player_odds_history")
+        first_recorded = cursor.fetchone()['first_recorded']
+        month = (first_recorded.date() if first_recorded else date.today()).replace(day=1)
+    
+    last_month = date.today().replace(day=1)
+    for _ in range(months_ahead):
+        last_month = _add_month(last_month)
+    
+    new_partitions = []
+    while month <= last_month:
+        next_month = _add_month(month)
+        new_partitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{next_month:%Y-%m-%d}'))"
+        )
+        month = next_month
+    if not new_partitions:
+        return
+    
+    new_partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+    cursor.execute(f"""
+        ALTER TABLE player_odds_history
+        REORGANIZE PARTITION pmax INTO ({", ".join(new_partitions)})
+    """)
+    logger.info(f"Added {len(new_partitions) - 1} monthly partition(s) to player_odds_history")
+
+
+def _missing_indexes(cursor) -> Dict[str, List[str]]:
+    """
+    Find the secondary indexes from _SECONDARY_INDEXES that don't exist yet.
+    
+    Args:
+        cursor: Open database cursor
+    
+    Returns:
+        Missing index names per table
+    """
+    indexes = _existing_indexes(cursor, _INDEXED_TABLES)
+    
+    missing: Dict[str, List[str]] = {}
+    for table, index, _ in _SECONDARY_INDEXES:
+        if index not in indexes[table]:
+            missing.setdefault(table, []).append(index)
+    return missing
+
+
+def _add_missing_indexes(cursor) -> None:
+    """
+    Create any secondary index from _SECONDARY_INDEXES that doesn't exist yet
+    and drop the ones listed in _DROPPED_INDEXES.
+    
+    All index changes of a table are applied by a single ALTER, so a
+    superseded index is only dropped together with its replacement.
+    
+    Args:
+        cursor: Open database cursor
+    """
+    indexes = _existing_indexes(cursor, _INDEXED_TABLES)
+    
+    changes: Dict[str, List[str]] = {}
+    for table, index, clause in _ADD_INDEX_CLAUSES:
+        if index not in indexes[table]:
+            changes.setdefault(table, []).append(clause)
+    for table, index in _DROPPED_INDEXES:
+        if index in indexes[table]:
+            changes.setdefault(table, []).append(f"DROP INDEX {index}")
+    
+    for table, clauses in changes.items():
+        _alter_table(cursor, f"ALTER TABLE {table} {', '.join(clauses)}", _INDEX_HINTS)
+        logger.info(f"Updated indexes of {table}: {', '.join(clauses)}")
+
+
+def _stamp_schema_version(cursor) -> None:
+    """Record that the current schema version has been fully applied."""
+    cursor.execute(_INSERT_SCHEMA_VERSION, (_SCHEMA_VERSION,))
+
+
+def _warn_pending_retypes() -> None:
+    """Log that some columns kept their old types under a stamped schema version."""
+    logger.warning(
+        f"Schema version {_SCHEMA_VERSION} recorded, but some columns still have "
+        f"their old types because existing rows don't fit the compact types; fix "
+        f"those rows and delete the version from schema_version to retry the conversion"
+    )
+
+
+def create_tables(config: Config, with_indexes: bool = True) -> None:
     """
     Create database tables if they don't exist.
     
+    Bootstrap loaders that bulk-insert into freshly created tables can pass
+    ``with_indexes=False`` and call finalize_indexes() after the load, so
+    the secondary indexes are built once instead of maintained per row.
+    Until then the schema version stays unstamped, so the next regular
+    ``create_tables`` call builds whatever indexes are still missing.
+    
     Args:
         config: Application configuration
+        with_indexes: Whether to create the secondary indexes as well
     """
-    db = DatabaseConnection(config)
+    schema_key = _schema_key(config)
+    if with_indexes and schema_key in _SCHEMA_CHECKED:
+        return
+    
+    db = DatabaseConnection(config, multi_statements=True)
     
     try:
         with db.get_connection() as conn:
             with conn.cursor() as cursor:
-                # Create games table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS games (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        game_id VARCHAR(50) UNIQUE NOT NULL,
-                        home_team VARCHAR(10) NOT NULL,
-                        away_team VARCHAR(10) NOT NULL,
-                        game_date DATE NOT NULL,
-                        game_time TIME,
-                        status VARCHAR(20),
-                        season VARCHAR(10),
-                        season_type VARCHAR(20),
-                        home_team_name VARCHAR(100),
-                        away_team_name VARCHAR(100),
-                        home_team_logo_url VARCHAR(255),
-                        away_team_logo_url VARCHAR(255),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        INDEX idx_game_date (game_date),
-                        INDEX idx_game_id (game_id),
-                        INDEX idx_status (status)
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """)
-                
-                # Add logo URL columns if they don't exist (for existing tables)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN home_team_logo_url VARCHAR(255)
-                    """)
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN away_team_logo_url VARCHAR(255)
-                    """)
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add score columns if they don't exist (for storing game scores)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN home_score INT NULL
-                    """)
-                    logger.info("Added home_score column to games")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN away_score INT NULL
-                    """)
-                    logger.info("Added away_score column to games")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN score_last_update DATETIME NULL
-                    """)
-                    logger.info("Added score_last_update column to games")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                try:
-                    cursor.execute("""
-                        ALTER TABLE games 
-                        ADD COLUMN game_completed TINYINT(1) DEFAULT 0
-                    """)
-                    logger.info("Added game_completed column to games")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Create game_lineups table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS game_lineups (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        game_id VARCHAR(50) NOT NULL,
-                        lineup_date DATE NOT NULL,
-                        team_abbr VARCHAR(10) NOT NULL,
-                        position VARCHAR(50) NOT NULL,
-                        player_id INT NOT NULL,
-                        player_name VARCHAR(100) NOT NULL,
-                        player_photo_url VARCHAR(255),
-                        confirmed TINYINT(1) DEFAULT 0,
-                        player_status VARCHAR(10) DEFAULT 'BENCH',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        UNIQUE KEY unique_lineup (game_id, team_abbr, position, lineup_date),
-                        INDEX idx_game_id (game_id),
-                        INDEX idx_lineup_date (lineup_date),
-                        INDEX idx_team_abbr (team_abbr),
-                        FOREIGN KEY (game_id) REFERENCES games(game_id) ON DELETE CASCADE
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """)
+                if with_indexes and _is_schema_current(cursor):
+                    logger.debug(f"Database schema is up to date (version {_SCHEMA_VERSION})")
+                    _SCHEMA_CHECKED.add(schema_key)
+                    return
                 
-                # Update position column size if it exists and is too small
-                # This handles existing databases that have VARCHAR(5)
+                # Foreign key checks are off for the whole migration
+                # (set by the first statement of the script) and restored
+                # before the pooled connection is handed back
                 try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        MODIFY COLUMN position VARCHAR(50) NOT NULL
-                    """)
-                    logger.info("Updated position column size to VARCHAR(50)")
-                except Exception as e:
-                    # Column might not exist yet or already has correct size
-                    logger.debug(f"Position column update: {e}")
-                    pass
-                
-                # Add player_photo_url column if it doesn't exist (for existing tables)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN player_photo_url VARCHAR(255)
-                    """)
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add player_status column if it doesn't exist (for existing tables)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN player_status VARCHAR(10) DEFAULT 'BENCH'
-                    """)
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add points_line column if it doesn't exist (for storing odds points)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN points_line DECIMAL(5,1) NULL
-                    """)
-                    logger.info("Added points_line column to game_lineups")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add assists_line column if it doesn't exist (for storing assists odds)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN assists_line DECIMAL(5,1) NULL
-                    """)
-                    logger.info("Added assists_line column to game_lineups")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add rebounds_line column if it doesn't exist (for storing rebounds odds)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN rebounds_line DECIMAL(5,1) NULL
-                    """)
-                    logger.info("Added rebounds_line column to game_lineups")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Add over_under_history column if it doesn't exist (for storing OVER/UNDER history JSON)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE game_lineups 
-                        ADD COLUMN over_under_history JSON NULL
-                    """)
-                    logger.info("Added over_under_history column to game_lineups")
-                except Exception:
-                    # Column already exists, ignore
-                    pass
-                
-                # Create team_depth_charts table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS team_depth_charts (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        team_abbr VARCHAR(10) NOT NULL,
-                        season INT NOT NULL,
-                        position VARCHAR(5) NOT NULL,
-                        depth INT NOT NULL,
-                        player_id INT NOT NULL,
-                        player_name VARCHAR(100) NOT NULL,
-                        player_photo_url VARCHAR(255),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        UNIQUE KEY unique_depth_chart (team_abbr, season, position, depth, player_id),
-                        INDEX idx_team_abbr (team_abbr),
-                        INDEX idx_season (season),
-                        INDEX idx_player_name (player_name)
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """)
-                
-                # Create player_game_logs table for storing game logs locally
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS player_game_logs (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        player_id INT NOT NULL,
-                        player_name VARCHAR(100) NOT NULL,
-                        game_date DATE NOT NULL,
-                        matchup VARCHAR(50),
-                        points DECIMAL(5,1),
-                        minutes_played DECIMAL(5,1),
-                        start_position VARCHAR(5) NULL,
-                        starter_status VARCHAR(10) NULL,
-                        field_goals_made INT,
-                        field_goals_attempted INT,
-                        three_pointers_made INT,
-                        three_pointers_attempted INT,
-                        free_throws_made INT,
-                        free_throws_attempted INT,
-                        rebounds INT,
-                        assists INT,
-                        steals INT,
-                        blocks INT,
-                        turnovers INT,
-                        personal_fouls INT,
-                        plus_minus INT,
-                        game_data JSON,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                        UNIQUE KEY unique_game_log (player_id, game_date, matchup),
-                        INDEX idx_player_id (player_id),
-                        INDEX idx_game_date (game_date),
-                        INDEX idx_player_date (player_id, game_date)
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """)
-
-                # Add start_position and starter_status columns if they don't exist (migration)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE player_game_logs
-                        ADD COLUMN start_position VARCHAR(5) NULL
-                    """)
-                    logger.info("Added start_position column to player_game_logs")
-                except Exception:
-                    pass
+                    # Create all tables with a single multi-statement execute
+                    cursor.execute(_DISABLE_CHECKS + _CREATE_TABLES_SCRIPT)
+                    while cursor.nextset():
+                        pass
+                    
+                    # Look up existing columns once and only ALTER what is missing
+                    # (for tables created before these columns were introduced)
+                    columns = _existing_columns(cursor, _MIGRATED_TABLES)
+                    
+                    # All missing columns of a table are added by one ALTER: one
+                    # parse, one metadata lock and one round trip per table
+                    missing: Dict[str, List[str]] = {}
+                    added: Dict[str, List[str]] = {}
+                    for table, column, clause in _ADD_COLUMN_CLAUSES:
+                        if column not in columns[table]:
+                            missing.setdefault(table, []).append(clause)
+                            added.setdefault(table, []).append(column)
+                    
+                    for table, clauses in missing.items():
+                        _alter_table(cursor, f"ALTER TABLE {table} {', '.join(clauses)}", _ADD_COLUMN_HINTS)
+                        logger.info(f"Added {', '.join(added[table])} column(s) to {table}")
+                    
+                    _move_lineup_odds(cursor, columns['game_lineups'])
+                    retyped = _retype_columns(cursor, columns)
+                    
+                    # Partition odds history tables created before partitioning
+                    if not _odds_partitions(cursor):
+                        cursor.execute(_PARTITION_ODDS_HISTORY)
+                        logger.info("Partitioned player_odds_history by month")
+                    _extend_odds_partitions(cursor)
+                    
+                    # Update position column size if it is too small
+                    if columns['game_lineups'].get('position', 'varchar(50)') != 'varchar(50)':
+                        _alter_table(cursor, _RESIZE_POSITION, _MODIFY_COLUMN_HINTS)
+                        logger.info("Updated position column size to VARCHAR(50)")
+                    
+                    if not with_indexes:
+                        pending = _missing_indexes(cursor)
+                        if pending:
+                            logger.warning(
+                                f"Database tables created; {sum(map(len, pending.values()))} secondary "
+                                f"index(es) on {', '.join(pending)} deferred until finalize_indexes() "
+                                f"or the next create_tables() call"
+                            )
+                        return
+                    
+                    _add_missing_indexes(cursor)
+                    
+                    # A conversion rejected because of existing data would be
+                    # rejected again on every start (each attempt copying the
+                    # table), so the version is stamped either way and the
+                    # failure is only reported
+                    _stamp_schema_version(cursor)
+                    if not retyped:
+                        _warn_pending_retypes()
+                    logger.info(f"Database tables created successfully (schema version {_SCHEMA_VERSION})")
+                finally:
+                    cursor.execute(_RESTORE_CHECKS)
+        
+        _SCHEMA_CHECKED.add(schema_key)
+    
+    except Exception as e:
+        logger.error(f"Error creating tables: {e}")
+        raise
 
-                try:
-                    cursor.execute("""
-                        ALTER TABLE player_game_logs
-                        ADD COLUMN starter_status VARCHAR(10) NULL
-                    """)
-                    logger.info("Added starter_status column to player_game_logs")
-                except Exception:
-                    pass
-                
-                # Create player_odds_history table for storing odds history
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS player_odds_history (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        player_id INT NOT NULL,
-                        player_name VARCHAR(100) NOT NULL,
-                        game_id VARCHAR(50) NOT NULL,
-                        game_date DATE NOT NULL,
-                        team_abbr VARCHAR(10) NOT NULL,
-                        points_line DECIMAL(5,1) NOT NULL,
-                        assists_line DECIMAL(5,1) NULL,
-                        rebounds_line DECIMAL(5,1) NULL,
-                        over_odds INT,
-                        under_odds INT,
-                        bookmaker VARCHAR(50),
-                        recorded_at DATETIME NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        INDEX idx_player_id (player_id),
-                        INDEX idx_game_id (game_id),
-                        INDEX idx_game_date (game_date),
-                        INDEX idx_recorded_at (recorded_at),
-                        INDEX idx_player_game (player_id, game_id)
-                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """)
-                
-                # Add assists_line and rebounds_line columns if they don't exist (migration)
-                try:
-                    cursor.execute("""
-                        ALTER TABLE player_odds_history 
-                        ADD COLUMN assists_line DECIMAL(5,1) NULL
-                    """)
-                    logger.info("Added assists_line column to player_odds_history")
-                except Exception:
-                    pass
-                
-                try:
-                    cursor.execute("""
-                        ALTER TABLE player_odds_history 
-                        ADD COLUMN rebounds_line DECIMAL(5,1) NULL
-                    """)
-                    logger.info("Added rebounds_line column to player_odds_history")
-                except Exception:
-                    pass
-                
-                conn.commit()
-                logger.info("Database tables created successfully")
+
+def finalize_indexes(config: Config) -> None:
+    """
+    Build the secondary indexes deferred by ``create_tables(with_indexes=False)``.
+    
+    Args:
+        config: Application configuration
+    """
+    db = DatabaseConnection(config, multi_statements=True)
+    
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                _add_missing_indexes(cursor)
+                logger.info("Secondary indexes created successfully")
                 
+                _stamp_schema_version(cursor)
+                if _pending_retypes(_existing_columns(cursor, _MIGRATED_TABLES)):
+                    _warn_pending_retypes()
+        
+        _SCHEMA_CHECKED.add(_schema_key(config))
+    
     except Exception as e:
-        logger.error(f"Error creating tables: {e}")
+        logger.error(f"Error creating indexes: {e}")
         raise
-    finally:
-        db.close()
 
+
+def extend_odds_partitions(config: Config, months_ahead: int = 1) -> None:
+    """
+    Make sure player_odds_history has monthly partitions for upcoming months.
+    
+    Meant to run periodically (e.g. a monthly cron) so new odds never land
+    in the catch-all pmax partition.
+    
+    Args:
+        config: Application configuration
+        months_ahead: How many future months should already have a partition
+    """
+    db = DatabaseConnection(config, multi_statements=True)
+    
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                _extend_odds_partitions(cursor, months_ahead)
+    
+    except Exception as e:
+        logger.error(f"Error extending odds partitions: {e}")
+        raise
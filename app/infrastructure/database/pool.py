@@ -0,0 +1,72 @@
+"""
+Process-wide MySQL connection pools.
+"""
+import threading
+from typing import Dict, Tuple
+
+import pymysql
+from dbutils.pooled_db import PooledDB
+from pymysql.constants import CLIENT
+
+from app.config.settings import Config
+
+_pools: Dict[Tuple, PooledDB] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(config: Config, multi_statements: bool = False) -> PooledDB:
+    """
+    Get the shared connection pool for the configured database.
+    
+    Pools are created on first use and then reused by every
+    DatabaseConnection pointing at the same database, so connections
+    (and their TCP/auth handshakes) survive across requests and callers.
+    
+    Args:
+        config: Application configuration
+        multi_statements: Whether connections accept several ``;``-separated
+            statements per execute call and run in autocommit mode (only
+            used for schema scripts)
+    
+    Returns:
+        Shared PooledDB instance
+    """
+    key = (
+        config.MYSQL_HOST,
+        config.MYSQL_PORT,
+        config.MYSQL_USER,
+        config.MYSQL_DATABASE,
+        multi_statements,
+    )
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            # The migration pool is used once at startup, so it keeps no idle
+            # connections around; the application pool keeps a few warm. The
+            # pool rolls back any open transaction when a connection returns.
+            # Schema scripts run in autocommit mode: DDL commits implicitly
+            # anyway, and this keeps the session from holding a transaction
+            # (and its metadata locks) open across statements.
+            pool = PooledDB(
+                creator=pymysql,
+                mincached=0 if multi_statements else config.MYSQL_POOL_MIN_CACHED,
+                maxcached=1 if multi_statements else config.MYSQL_POOL_SIZE,
+                maxconnections=config.MYSQL_POOL_MAX_CONNECTIONS,
+                blocking=True,
+                ping=1,
+                host=config.MYSQL_HOST,
+                port=config.MYSQL_PORT,
+                user=config.MYSQL_USER,
+                password=config.MYSQL_PASSWORD,
+                database=config.MYSQL_DATABASE,
+                charset='utf8mb4',
+                cursorclass=pymysql.cursors.DictCursor,
+                autocommit=multi_statements,
+                client_flag=CLIENT.MULTI_STATEMENTS if multi_statements else 0
+            )
+            _pools[key] = pool
+    return pool
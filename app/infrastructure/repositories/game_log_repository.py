@@ -1,16 +1,344 @@
 """
 Repository for player game logs operations.
 """
+import hashlib
 import logging
-import unicodedata
+import re
 import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import pymysql
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Set
+from datetime import date, datetime
 
 from app.infrastructure.database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    # NBA API rows built from DataFrames may carry numpy scalars
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps_game_data(game: Dict[str, Any]) -> str:
+        """Serialize game fields for the game_data JSON column."""
+        return orjson.dumps(game, default=str, option=_ORJSON_OPTIONS).decode()
+
+    def _loads_game_data(data: str) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _dumps_game_data(game: Dict[str, Any]) -> str:
+        """Serialize game fields for the game_data JSON column."""
+        return json.dumps(game, default=str)
+
+    def _loads_game_data(data: str) -> Any:
+        return json.loads(data)
+
+# Date formats returned by the NBA API, told apart by a single match:
+# "YYYY-MM-DD" (optionally followed by a time), "MMM DD, YYYY" (day may be
+# unpadded, comma may be missing) and "MM/DD/YYYY" or "MM/DD/YY"
+_DATE_FORMATS = re.compile(
+    r'^(?:(?P<iso>\d{4}-\d{2}-\d{2})'
+    r'|(?P<mon>[A-Za-z]{3} \d{1,2},? \d{4})$'
+    r'|\d{1,2}/\d{1,2}/(?P<year>\d{4}|\d{2})$)'
+)
+
+# STARTER flag values found in stored game_data; strings are compared
+# stripped and casefolded (True/False hash like 1/0)
+_TRUE_FLAGS = frozenset((1, '1', 'true', 'y', 'yes'))
+_FALSE_FLAGS = frozenset((0, '0', 'false', 'n', 'no'))
+
+# Columns selected when reading game logs, in SELECT order
+_GAME_LOG_COLUMNS = (
+    'player_id', 'player_name', 'game_date', 'matchup',
+    'points', 'minutes_played', 'start_position', 'starter_status',
+    'field_goals_made', 'field_goals_attempted',
+    'three_pointers_made', 'three_pointers_attempted',
+    'free_throws_made', 'free_throws_attempted',
+    'rebounds', 'assists', 'steals', 'blocks',
+    'turnovers', 'personal_fouls', 'plus_minus',
+    'game_data',
+)
+
+# One statement serves both limited and unlimited reads; MySQL has no
+# "LIMIT ALL", so the largest row count stands in for it
+_SELECT_PLAYER_GAME_LOGS = f"""
+    SELECT {', '.join(_GAME_LOG_COLUMNS)}
+    FROM player_game_logs
+    WHERE player_id = %s
+    ORDER BY game_date DESC, id DESC
+    LIMIT %s
+"""
+_NO_LIMIT = 18446744073709551615
+
+# player_name compares case- and accent-insensitively under
+# utf8mb4_unicode_ci (as LOWER(player_name) = LOWER(%s) did), so a plain
+# equality keeps the lookup on idx_player_name_date
+_SELECT_PLAYER_GAME_LOGS_BY_NAME = f"""
+    SELECT {', '.join(_GAME_LOG_COLUMNS)}
+    FROM player_game_logs
+    WHERE player_name = %s
+    ORDER BY game_date DESC, id DESC
+    LIMIT %s
+"""
+
+# NBA API stat keys, in player_game_logs column order (field_goals_made ...
+# plus_minus)
+_STAT_KEYS = (
+    'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA',
+    'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PLUS_MINUS',
+)
+
+# Value ranges of the columns filled from _STAT_KEYS, in the same order: the
+# counters are TINYINT UNSIGNED and plus_minus is SMALLINT
+_STAT_RANGES = ((0, 255),) * 12 + ((-32768, 32767),)
+
+# Ranges of points (TINYINT UNSIGNED) and minutes_played (DECIMAL(4,1))
+_POINTS_RANGE = (0, 255)
+_MINUTES_RANGE = (0, 999.9)
+
+# Widths of the VARCHAR columns filled from the API
+_MATCHUP_WIDTH = 50
+_START_POSITION_WIDTH = 5
+_STARTER_STATUS_WIDTH = 10
+
+# NBA API keys already stored in their own player_game_logs columns; they are
+# left out of game_data, which keeps only the remaining fields (including
+# START_POSITION/STARTER, read back as a starter fallback)
+_COLUMN_KEYS = frozenset(('GAME_DATE', 'MATCHUP', 'PTS', 'MIN') + _STAT_KEYS)
+
+# Upsert of one game log row; sent through executemany, which PyMySQL expands
+# into a multi-row VALUES list
+_UPSERT_GAME_LOG = """
+    INSERT INTO player_game_logs (
+        player_id, player_name, game_date, matchup,
+        points, minutes_played, start_position, starter_status,
+        field_goals_made, field_goals_attempted,
+        three_pointers_made, three_pointers_attempted,
+        free_throws_made, free_throws_attempted,
+        rebounds, assists, steals, blocks,
+        turnovers, personal_fouls, plus_minus,
+        game_data, game_data_hash
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s
+    )
+    ON DUPLICATE KEY UPDATE
+        player_name = VALUES(player_name),
+        matchup = VALUES(matchup),
+        points = VALUES(points),
+        minutes_played = VALUES(minutes_played),
+        start_position = COALESCE(VALUES(start_position), start_position),
+        starter_status = COALESCE(VALUES(starter_status), starter_status),
+        field_goals_made = VALUES(field_goals_made),
+        field_goals_attempted = VALUES(field_goals_attempted),
+        three_pointers_made = VALUES(three_pointers_made),
+        three_pointers_attempted = VALUES(three_pointers_attempted),
+        free_throws_made = VALUES(free_throws_made),
+        free_throws_attempted = VALUES(free_throws_attempted),
+        rebounds = VALUES(rebounds),
+        assists = VALUES(assists),
+        steals = VALUES(steals),
+        blocks = VALUES(blocks),
+        turnovers = VALUES(turnovers),
+        personal_fouls = VALUES(personal_fouls),
+        plus_minus = VALUES(plus_minus),
+        -- Rewrite the JSON only when its fingerprint changed; this must
+        -- come before game_data_hash is overwritten below
+        game_data = IF(game_data_hash <=> VALUES(game_data_hash), game_data, VALUES(game_data)),
+        game_data_hash = VALUES(game_data_hash),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Copy lineup position/status onto existing game logs, mirroring
+# _lineup_info: non-bench positions are starting positions, and a missing
+# player_status is derived from the position. The second statement falls
+# back to the player's name for dates without a lineup row for the id.
+_BACKFILL_LINEUP_INFO_BY_ID = """
+    UPDATE player_game_logs AS logs
+    JOIN game_lineups AS lineups
+      ON lineups.player_id = logs.player_id
+     AND lineups.lineup_date = logs.game_date
+    SET logs.start_position = CASE
+            WHEN lineups.position <> '' AND lineups.position NOT LIKE 'BENCH%%'
+            THEN lineups.position
+        END,
+        logs.starter_status = COALESCE(NULLIF(lineups.player_status, ''), CASE
+            WHEN lineups.position LIKE 'BENCH%%' THEN 'BENCH'
+            WHEN lineups.position <> '' THEN 'STARTER'
+        END),
+        logs.updated_at = CURRENT_TIMESTAMP
+    WHERE logs.player_id = %s
+      AND logs.game_date IN %s
+"""
+_BACKFILL_LINEUP_INFO_BY_NAME = """
+    UPDATE player_game_logs AS logs
+    JOIN game_lineups AS lineups
+      ON lineups.lineup_date = logs.game_date
+     AND lineups.player_name = %s
+    SET logs.start_position = CASE
+            WHEN lineups.position <> '' AND lineups.position NOT LIKE 'BENCH%%'
+            THEN lineups.position
+        END,
+        logs.starter_status = COALESCE(NULLIF(lineups.player_status, ''), CASE
+            WHEN lineups.position LIKE 'BENCH%%' THEN 'BENCH'
+            WHEN lineups.position <> '' THEN 'STARTER'
+        END),
+        logs.updated_at = CURRENT_TIMESTAMP
+    WHERE logs.player_id = %s
+      AND logs.game_date IN %s
+      AND NOT EXISTS (
+          SELECT 1 FROM game_lineups AS by_id
+          WHERE by_id.player_id = logs.player_id
+            AND by_id.lineup_date = logs.game_date
+      )
+"""
+
+
+@lru_cache(maxsize=8192)
+def _parse_game_date(game_date_str: str) -> Optional[date]:
+    """
+    Parse a game date as returned by the NBA API.
+    
+    The API uses several formats, and game logs repeat the same date
+    strings many times, so results are memoized per string. The cache is
+    process-wide, so ingests across many players share it; its hit rate can
+    be checked with ``_parse_game_date.cache_info()``.
+    
+    Args:
+        game_date_str: Stripped, non-empty date string
+        
+    Returns:
+        Parsed date, or None if the format is not recognized
+    """
+    match = _DATE_FORMATS.match(game_date_str)
+    if match is None:
+        logger.warning(f"Unknown date format: {game_date_str}")
+        return None
+    
+    try:
+        if match['iso']:
+            return date.fromisoformat(match['iso'])
+        if match['mon']:
+            return datetime.strptime(match['mon'].replace(',', ''), '%b %d %Y').date()
+        year_format = '%Y' if len(match['year']) == 4 else '%y'
+        return datetime.strptime(game_date_str, f'%m/%d/{year_format}').date()
+    except ValueError as e:
+        # Right shape but not a real date (e.g. month 13)
+        logger.warning(f"Could not parse game date '{game_date_str}': {e}")
+        return None
+
+
+def _fingerprint(game_data_json: str) -> int:
+    """64-bit fingerprint of a game_data document, stored in game_data_hash."""
+    return int.from_bytes(hashlib.blake2b(game_data_json.encode(), digest_size=8).digest(), 'big')
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """
+    Convert a stat value to float, or None if it isn't numeric.
+    
+    The NBA API almost always returns ints/floats already, so those are
+    handled by type checks; only other types go through float() parsing.
+    """
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_minutes(value: Any) -> Optional[float]:
+    """
+    Convert minutes played to float minutes, or None if unparseable.
+    
+    The NBA API returns minutes either as "MM:SS" or as a number.
+    """
+    if isinstance(value, str):
+        mins, sep, secs = value.partition(':')
+        if sep:
+            try:
+                return int(mins) + int(secs) / 60.0
+            except ValueError:
+                return None
+    return _to_float(value)
+
+
+def _in_range(value: Any, bounds: tuple, digits: int = 0) -> bool:
+    """
+    Check that a value fits a numeric column once MySQL rounds it.
+    
+    None (stored as NULL) always fits; anything that isn't numeric doesn't.
+    """
+    if value is None:
+        return True
+    number = _to_float(value)
+    if number is None:
+        return False
+    low, high = bounds
+    return low <= round(number, digits) <= high
+
+
+def _rejected_column(matchup: Any, points: Optional[float], minutes: Optional[float],
+                     start_position: Any, starter_status: Any, stats: tuple) -> Optional[str]:
+    """
+    Find a value the player_game_logs columns would reject.
+    
+    Rows are checked before the batched upsert, so one bad game is left out
+    instead of failing the whole statement.
+    
+    Returns:
+        Name of the first column whose value doesn't fit, or None
+    """
+    if matchup is not None and len(str(matchup)) > _MATCHUP_WIDTH:
+        return 'matchup'
+    if not _in_range(points, _POINTS_RANGE):
+        return 'points'
+    if not _in_range(minutes, _MINUTES_RANGE, digits=1):
+        return 'minutes_played'
+    if start_position is not None and len(str(start_position)) > _START_POSITION_WIDTH:
+        return 'start_position'
+    if starter_status is not None and len(str(starter_status)) > _STARTER_STATUS_WIDTH:
+        return 'starter_status'
+    for key, value, bounds in zip(_STAT_KEYS, stats, _STAT_RANGES):
+        if not _in_range(value, bounds):
+            return key
+    return None
+
+
+def _lineup_info(position: Optional[str], player_status: Optional[str]) -> Dict[str, Any]:
+    """
+    Derive starter status/position from a saved lineup row.
+    
+    Args:
+        position: Lineup position (BENCH-* for bench players)
+        player_status: Stored player status, if any
+        
+    Returns:
+        Dictionary with start_position and starter_status
+    """
+    start_position = None
+    starter_status = None
+    if player_status:
+        starter_status = player_status
+    if position and not str(position).startswith('BENCH'):
+        start_position = position
+        if not starter_status:
+            starter_status = 'STARTER'
+    elif position and str(position).startswith('BENCH') and not starter_status:
+        starter_status = 'BENCH'
+
+    return {
+        'start_position': start_position,
+        'starter_status': starter_status
+    }
+
 
 class GameLogRepository:
     """
@@ -40,57 +368,48 @@ class GameLogRepository:
         Returns:
             Number of games saved
         """
+        if not games:
+            return 0
+        
         saved_count = 0
+        rows = []
         
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
+                # Parse every game's date first, so the saved lineups for all
+                # of them can be fetched up front instead of per game
+                dated_games = []
                 for game in games:
                     try:
+                        # Normalize keys once; uppercase keys (the NBA API
+                        # default) win over lowercase variants, as before
+                        fields = {key.upper(): value for key, value in game.items() if not key.isupper()}
+                        fields.update(game)
+                        
                         # Extract game data
-                        game_date_str = game.get('GAME_DATE', game.get('game_date', ''))
+                        game_date_str = str(fields.get('GAME_DATE') or '').strip()
                         if not game_date_str:
                             continue
                         
-                        # Parse date - NBA API can return dates in multiple formats
-                        game_date = None
-                        try:
-                            # Clean the date string
-                            game_date_str = str(game_date_str).strip()
-                            
-                            # Try format "YYYY-MM-DD" first (most common)
-                            if len(game_date_str) >= 10 and '-' in game_date_str and game_date_str[4] == '-':
-                                game_date = datetime.strptime(game_date_str[:10], '%Y-%m-%d').date()
-                            # Try format "MMM DD, YYYY" (e.g., "Dec 06, 2025" or "Dec 6, 2025")
-                            elif ',' in game_date_str:
-                                # Handle both "Dec 06, 2025" and "Dec 6, 2025"
-                                try:
-                                    game_date = datetime.strptime(game_date_str, '%b %d, %Y').date()
-                                except ValueError:
-                                    # Try with zero-padded day
-                                    try:
-                                        game_date = datetime.strptime(game_date_str, '%b %d, %Y').date()
-                                    except ValueError:
-                                        # Try without comma (some variations)
-                                        game_date = datetime.strptime(game_date_str.replace(',', ''), '%b %d %Y').date()
-                            # Try format "MM/DD/YYYY"
-                            elif '/' in game_date_str and len(game_date_str.split('/')) == 3:
-                                parts = game_date_str.split('/')
-                                if len(parts[2]) == 4:  # Full year
-                                    game_date = datetime.strptime(game_date_str, '%m/%d/%Y').date()
-                                else:  # 2-digit year
-                                    game_date = datetime.strptime(game_date_str, '%m/%d/%y').date()
-                            else:
-                                logger.warning(f"Unknown date format: {game_date_str}")
-                                continue
-                        except Exception as e:
-                            logger.warning(f"Could not parse game date '{game_date_str}': {e}")
+                        game_date = _parse_game_date(game_date_str)
+                        if game_date is None:
                             continue
                         
-                        matchup = game.get('MATCHUP', game.get('matchup', ''))
-                        points = game.get('PTS', game.get('pts'))
-                        minutes = game.get('MIN', game.get('min'))
+                        dated_games.append((game, fields, game_date))
+                    except Exception as e:
+                        logger.error(f"Error preparing game log for player {player_id}: {e}")
+                
+                lineup_infos = self._prefetch_lineup_info(
+                    cursor, player_id, player_name, {game_date for _, _, game_date in dated_games}
+                )
+                
+                for game, fields, game_date in dated_games:
+                    try:
+                        matchup = fields.get('MATCHUP', '')
+                        points = fields.get('PTS')
+                        minutes = fields.get('MIN')
                         
-                        start_position = game.get('START_POSITION', game.get('start_position'))
+                        start_position = fields.get('START_POSITION')
                         if isinstance(start_position, str):
                             start_position = start_position.strip()
                             if start_position == '':
@@ -101,9 +420,7 @@ class GameLogRepository:
                             starter_status = 'STARTER'
 
                         # Try to hydrate starter info from saved lineups (same date)
-                        lineup_info = self.get_lineup_info_for_player_date(player_id, game_date)
-                        if not lineup_info and player_name:
-                            lineup_info = self.get_lineup_info_for_player_name_date(player_name, game_date)
+                        lineup_info = lineup_infos.get(game_date)
                         if lineup_info:
                             if lineup_info.get('start_position'):
                                 start_position = lineup_info.get('start_position')
@@ -112,190 +429,152 @@ class GameLogRepository:
                                 starter_status = lineup_info.get('starter_status')
 
                         # Extract other stats
-                        fgm = game.get('FGM', game.get('fgm'))
-                        fga = game.get('FGA', game.get('fga'))
-                        fg3m = game.get('FG3M', game.get('fg3m'))
-                        fg3a = game.get('FG3A', game.get('fg3a'))
-                        ftm = game.get('FTM', game.get('ftm'))
-                        fta = game.get('FTA', game.get('fta'))
-                        reb = game.get('REB', game.get('reb'))
-                        ast = game.get('AST', game.get('ast'))
-                        stl = game.get('STL', game.get('stl'))
-                        blk = game.get('BLK', game.get('blk'))
-                        tov = game.get('TOV', game.get('tov'))
-                        pf = game.get('PF', game.get('pf'))
-                        plus_minus = game.get('PLUS_MINUS', game.get('plus_minus'))
+                        stats = tuple(map(fields.get, _STAT_KEYS))
                         
-                        # Store full game data as JSON for future use
-                        game_data_json = json.dumps(game, default=str)
+                        # Store the fields without a column of their own as JSON
+                        # for future use
+                        extra_data = {key: value for key, value in game.items() if key.upper() not in _COLUMN_KEYS}
+                        game_data_json = _dumps_game_data(extra_data)
+                        game_data_hash = _fingerprint(game_data_json)
                         
-                        # Convert points to float if possible
-                        points_float = None
-                        if points is not None:
-                            try:
-                                points_float = float(points)
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Convert minutes to float if possible
-                        minutes_float = None
-                        if minutes is not None:
-                            try:
-                                # NBA API returns minutes as "MM:SS" or decimal
-                                if isinstance(minutes, str) and ':' in minutes:
-                                    parts = minutes.split(':')
-                                    minutes_float = float(parts[0]) + (float(parts[1]) / 60.0)
-                                else:
-                                    minutes_float = float(minutes)
-                            except (ValueError, TypeError):
-                                pass
+                        # Convert points and minutes to float if possible;
+                        # NBA API returns minutes as "MM:SS" or decimal
+                        points_float = _to_float(points)
+                        minutes_float = _to_minutes(minutes)
                         
-                        # Insert or update game log
-                        cursor.execute("""
-                            INSERT INTO player_game_logs (
-                                player_id, player_name, game_date, matchup,
-                                points, minutes_played, start_position, starter_status,
-                                field_goals_made, field_goals_attempted,
-                                three_pointers_made, three_pointers_attempted,
-                                free_throws_made, free_throws_attempted,
-                                rebounds, assists, steals, blocks,
-                                turnovers, personal_fouls, plus_minus,
-                                game_data
-                            ) VALUES (
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s
+                        rejected = _rejected_column(
+                            matchup, points_float, minutes_float,
+                            start_position, starter_status, stats
+                        )
+                        if rejected:
+                            logger.warning(
+                                f"Skipping game log for player {player_id} on {game_date}: "
+                                f"{rejected} value does not fit its column"
                             )
-                            ON DUPLICATE KEY UPDATE
-                                player_name = VALUES(player_name),
-                                matchup = VALUES(matchup),
-                                points = VALUES(points),
-                                minutes_played = VALUES(minutes_played),
-                                start_position = COALESCE(VALUES(start_position), start_position),
-                                starter_status = COALESCE(VALUES(starter_status), starter_status),
-                                field_goals_made = VALUES(field_goals_made),
-                                field_goals_attempted = VALUES(field_goals_attempted),
-                                three_pointers_made = VALUES(three_pointers_made),
-                                three_pointers_attempted = VALUES(three_pointers_attempted),
-                                free_throws_made = VALUES(free_throws_made),
-                                free_throws_attempted = VALUES(free_throws_attempted),
-                                rebounds = VALUES(rebounds),
-                                assists = VALUES(assists),
-                                steals = VALUES(steals),
-                                blocks = VALUES(blocks),
-                                turnovers = VALUES(turnovers),
-                                personal_fouls = VALUES(personal_fouls),
-                                plus_minus = VALUES(plus_minus),
-                                game_data = VALUES(game_data),
-                                updated_at = CURRENT_TIMESTAMP
-                        """, (
+                            continue
+                        
+                        rows.append((
                             player_id, player_name, game_date, matchup,
                             points_float, minutes_float, start_position, starter_status,
-                            fgm, fga, fg3m, fg3a, ftm, fta,
-                            reb, ast, stl, blk, tov, pf, plus_minus,
-                            game_data_json
+                            *stats,
+                            game_data_json, game_data_hash
                         ))
                         
-                        saved_count += 1
-                        
                     except Exception as e:
-                        logger.error(f"Error saving game log for player {player_id}: {e}")
+                        logger.error(f"Error preparing game log for player {player_id}: {e}")
                         continue
                 
-                conn.commit()
+                # Insert or update all game logs in one batch; PyMySQL rewrites
+                # executemany on an INSERT ... VALUES into a single multi-row
+                # statement, so the whole batch costs one round trip
+                if rows:
+                    try:
+                        cursor.executemany(_UPSERT_GAME_LOG, rows)
+                        saved_count = len(rows)
+                    except Exception as e:
+                        # The failed statement only rolled back itself
+                        logger.warning(
+                            f"Batch save of {len(rows)} game logs for player {player_id} "
+                            f"failed, saving one by one: {e}"
+                        )
+                        # Save row by row so one bad game doesn't drop the whole batch
+                        for row in rows:
+                            try:
+                                cursor.execute(_UPSERT_GAME_LOG, row)
+                                saved_count += 1
+                            except Exception as e:
+                                logger.error(f"Error saving game log for player {player_id} on {row[2]}: {e}")
+                                continue
                 
-                # Clean up old games (keep only last 25 per player)
-                self._cleanup_old_games(cursor, player_id, keep_count=25)
+                # Clean up old games (keep only last 25 per player); nothing
+                # can have grown past the cap if nothing was saved.
+                # _cleanup_old_games logs and swallows its own errors, and a
+                # failed statement only rolls back itself, so the upserts are
+                # committed together with the cleanup in a single commit
+                if saved_count:
+                    self._cleanup_old_games(cursor, player_id, keep_count=25)
                 conn.commit()
                 
                 return saved_count
 
+    def _prefetch_lineup_info(self, cursor, player_id: int, player_name: Optional[str],
+                              dates: Set[date]) -> Dict[date, Dict[str, Any]]:
+        """
+        Get starter status/position from saved lineups for several dates at once.
+        
+        Lineups are matched by player ID first; dates without a match fall
+        back to matching the player name (compared by the column's
+        case- and accent-insensitive collation).
+        
+        Args:
+            cursor: Database cursor
+            player_id: NBA player ID
+            player_name: Player name (used for the fallback)
+            dates: Lineup dates to look up
+            
+        Returns:
+            Lineup info keyed by date, for the dates that have one
+        """
+        if not dates:
+            return {}
+        
+        cursor.execute("""
+            SELECT lineup_date, position, player_status
+            FROM game_lineups
+            WHERE player_id = %s
+              AND lineup_date IN %s
+        """, (player_id, tuple(dates)))
+        infos: Dict[date, Dict[str, Any]] = {}
+        for row in cursor.fetchall():
+            if row['lineup_date'] not in infos:
+                infos[row['lineup_date']] = _lineup_info(row.get('position'), row.get('player_status'))
+        
+        missing = dates - infos.keys()
+        if missing and player_name:
+            infos.update(self._prefetch_lineup_info_by_name(cursor, player_name, missing))
+        return infos
+
+    def _prefetch_lineup_info_by_name(self, cursor, player_name: str,
+                                      dates: Set[date]) -> Dict[date, Dict[str, Any]]:
+        """
+        Get starter status/position from saved lineups by player name for several dates.
+        """
+        cursor.execute("""
+            SELECT lineup_date, position, player_status
+            FROM game_lineups
+            WHERE lineup_date IN %s
+              AND player_name = %s
+        """, (tuple(dates), player_name.strip()))
+        infos: Dict[date, Dict[str, Any]] = {}
+        for row in cursor.fetchall():
+            if row['lineup_date'] not in infos:
+                infos[row['lineup_date']] = _lineup_info(row.get('position'), row.get('player_status'))
+        return infos
+
     def get_lineup_info_for_player_date(self, player_id: int, game_date) -> Optional[Dict[str, Any]]:
         """
         Get starter status/position from saved lineups for a player on a specific date.
         """
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT position, player_status
-                    FROM game_lineups
-                    WHERE player_id = %s
-                      AND lineup_date = %s
-                    LIMIT 1
-                """, (player_id, game_date))
-                row = cursor.fetchone()
-                if not row:
-                    return None
-
-                position = row.get('position')
-                player_status = row.get('player_status')
-
-                start_position = None
-                starter_status = None
-                if player_status:
-                    starter_status = player_status
-                if position and not str(position).startswith('BENCH'):
-                    start_position = position
-                    if not starter_status:
-                        starter_status = 'STARTER'
-                elif position and str(position).startswith('BENCH') and not starter_status:
-                    starter_status = 'BENCH'
-
-                return {
-                    'start_position': start_position,
-                    'starter_status': starter_status
-                }
-
-    def get_lineup_info_for_player_name_date(self, player_name: str, game_date) -> Optional[Dict[str, Any]]:
+                infos = self._prefetch_lineup_info(cursor, player_id, None, {game_date})
+        # A single date was asked for, so any match is for that date
+        return next(iter(infos.values()), None)
+
+    def get_lineup_info_for_player_name_date(self, player_name: str,
+                                             game_date) -> Optional[Dict[str, Any]]:
         """
         Fallback: get starter status/position by player name and date.
+        
+        Names are compared by the column's case- and accent-insensitive
+        collation.
         """
-        def normalize_name(name: str) -> str:
-            if not name:
-                return ""
-            normalized = unicodedata.normalize('NFD', name)
-            normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-            return normalized.lower().strip()
-
-        target_name = normalize_name(player_name)
+        if not player_name:
+            return None
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT player_name, position, player_status
-                    FROM game_lineups
-                    WHERE lineup_date = %s
-                """, (game_date,))
-                rows = cursor.fetchall()
-                if not rows:
-                    return None
-
-                matched_row = None
-                for row in rows:
-                    if normalize_name(row.get('player_name')) == target_name:
-                        matched_row = row
-                        break
-
-                if not matched_row:
-                    return None
-
-                position = matched_row.get('position')
-                player_status = matched_row.get('player_status')
-
-                start_position = None
-                starter_status = None
-                if player_status:
-                    starter_status = player_status
-                if position and not str(position).startswith('BENCH'):
-                    start_position = position
-                    if not starter_status:
-                        starter_status = 'STARTER'
-                elif position and str(position).startswith('BENCH') and not starter_status:
-                    starter_status = 'BENCH'
-
-                return {
-                    'start_position': start_position,
-                    'starter_status': starter_status
-                }
+                infos = self._prefetch_lineup_info_by_name(cursor, player_name, {game_date})
+        return next(iter(infos.values()), None)
     
     def _cleanup_old_games(self, cursor, player_id: int, keep_count: int = 25) -> None:
         """
@@ -307,18 +586,22 @@ class GameLogRepository:
             keep_count: Number of recent games to keep
         """
         try:
+            # The derived table finds the newest game past the cap (its LIMIT
+            # keeps MySQL from merging it into the DELETE), and the join
+            # deletes it and everything older in the same statement; with
+            # no game past the cap the join is empty
             cursor.execute("""
-                DELETE FROM player_game_logs
-                WHERE player_id = %s
-                AND id NOT IN (
-                    SELECT id FROM (
-                        SELECT id FROM player_game_logs
-                        WHERE player_id = %s
-                        ORDER BY game_date DESC, id DESC
-                        LIMIT %s
-                    ) AS recent_games
-                )
-            """, (player_id, player_id, keep_count))
+                DELETE logs FROM player_game_logs AS logs
+                JOIN (
+                    SELECT game_date, id FROM player_game_logs
+                    WHERE player_id = %s
+                    ORDER BY game_date DESC, id DESC
+                    LIMIT 1 OFFSET %s
+                ) AS cutoff
+                WHERE logs.player_id = %s
+                AND (logs.game_date < cutoff.game_date
+                     OR (logs.game_date = cutoff.game_date AND logs.id <= cutoff.id))
+            """, (player_id, keep_count, player_id))
         except Exception as e:
             logger.warning(f"Could not cleanup old games for player {player_id}: {e}")
     
@@ -333,45 +616,31 @@ class GameLogRepository:
         Returns:
             List of game log dictionaries
         """
+        return list(self.iter_player_game_logs(player_id, limit))
+    
+    def iter_player_game_logs(self, player_id: int, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over game logs for a player, ordered by most recent first.
+        
+        Rows are streamed from the server with an unbuffered tuple cursor and
+        converted as they are consumed, so the raw result set and the
+        converted logs are never both held in memory. The connection stays
+        checked out until the iterator is exhausted or closed.
+        
+        Args:
+            player_id: NBA player ID
+            limit: Maximum number of games to return (default: all)
+            
+        Yields:
+            Game log dictionaries
+        """
         with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
-                if limit:
-                    cursor.execute("""
-                        SELECT 
-                            player_id, player_name, game_date, matchup,
-                            points, minutes_played, start_position, starter_status,
-                            field_goals_made, field_goals_attempted,
-                            three_pointers_made, three_pointers_attempted,
-                            free_throws_made, free_throws_attempted,
-                            rebounds, assists, steals, blocks,
-                            turnovers, personal_fouls, plus_minus,
-                            game_data
-                        FROM player_game_logs
-                        WHERE player_id = %s
-                        ORDER BY game_date DESC, id DESC
-                        LIMIT %s
-                    """, (player_id, limit))
-                else:
-                    cursor.execute("""
-                        SELECT 
-                            player_id, player_name, game_date, matchup,
-                            points, minutes_played, start_position, starter_status,
-                            field_goals_made, field_goals_attempted,
-                            three_pointers_made, three_pointers_attempted,
-                            free_throws_made, free_throws_attempted,
-                            rebounds, assists, steals, blocks,
-                            turnovers, personal_fouls, plus_minus,
-                            game_data
-                        FROM player_game_logs
-                        WHERE player_id = %s
-                        ORDER BY game_date DESC, id DESC
-                    """, (player_id,))
+            with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(_SELECT_PLAYER_GAME_LOGS, (player_id, limit or _NO_LIMIT))
                 
-                rows = cursor.fetchall()
-                
-                results = []
-                for row in rows:
-                    game_data = json.loads(row['game_data']) if row.get('game_data') else None
+                for values in cursor:
+                    row = dict(zip(_GAME_LOG_COLUMNS, values))
+                    game_data = _loads_game_data(row['game_data']) if row.get('game_data') else None
                     start_position = row.get('start_position')
                     starter_status = row.get('starter_status')
 
@@ -398,121 +667,68 @@ class GameLogRepository:
                             elif 'starter' in game_data:
                                 starter_flag = game_data.get('starter')
 
-                            if starter_flag is not None:
-                                if isinstance(starter_flag, str):
-                                    starter_flag = starter_flag.strip()
-                                if starter_flag in (1, '1', True, 'true', 'TRUE', 'Y', 'Yes'):
+                            if isinstance(starter_flag, str):
+                                starter_flag = starter_flag.strip().casefold()
+                            # Lists/objects from game_data are never flags
+                            # (and aren't hashable)
+                            if isinstance(starter_flag, (str, int, float)):
+                                if starter_flag in _TRUE_FLAGS:
                                     starter_status = 'STARTER'
-                                elif starter_flag in (0, '0', False, 'false', 'FALSE', 'N', 'No'):
+                                elif starter_flag in _FALSE_FLAGS:
                                     starter_status = 'BENCH'
 
-                    results.append({
-                        'player_id': row['player_id'],
-                        'player_name': row['player_name'],
-                        'game_date': row['game_date'],
-                        'matchup': row['matchup'],
-                        'points': float(row['points']) if row.get('points') is not None else None,
-                        'minutes_played': float(row['minutes_played']) if row.get('minutes_played') is not None else None,
-                        'field_goals_made': row.get('field_goals_made'),
-                        'field_goals_attempted': row.get('field_goals_attempted'),
-                        'three_pointers_made': row.get('three_pointers_made'),
-                        'three_pointers_attempted': row.get('three_pointers_attempted'),
-                        'free_throws_made': row.get('free_throws_made'),
-                        'free_throws_attempted': row.get('free_throws_attempted'),
-                        'rebounds': row.get('rebounds'),
-                        'assists': row.get('assists'),
-                        'steals': row.get('steals'),
-                        'blocks': row.get('blocks'),
-                        'turnovers': row.get('turnovers'),
-                        'personal_fouls': row.get('personal_fouls'),
-                        'plus_minus': row.get('plus_minus'),
-                        'starter_status': starter_status,
-                        'start_position': start_position,
-                        'game_data': game_data
-                    })
-
-                return results
+                    # Convert the remaining columns in place
+                    row['points'] = float(row['points']) if row.get('points') is not None else None
+                    row['minutes_played'] = float(row['minutes_played']) if row.get('minutes_played') is not None else None
+                    row['starter_status'] = starter_status
+                    row['start_position'] = start_position
+                    row['game_data'] = game_data
+                    yield row
 
     def get_player_game_logs_by_name(self, player_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get game logs for a player by name (case-insensitive), ordered by most recent first.
         """
+        return list(self.iter_player_game_logs_by_name(player_name, limit))
+    
+    def iter_player_game_logs_by_name(self, player_name: str,
+                                      limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over game logs for a player by name, ordered by most recent first.
+        
+        Streams rows like iter_player_game_logs, decoding game_data one row
+        at a time.
+        
+        Args:
+            player_name: Player name (case- and accent-insensitive)
+            limit: Maximum number of games to return (default: all)
+            
+        Yields:
+            Game log dictionaries
+        """
         if not player_name:
-            return []
+            return
         with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
-                if limit:
-                    cursor.execute("""
-                        SELECT 
-                            player_id, player_name, game_date, matchup,
-                            points, minutes_played, start_position, starter_status,
-                            field_goals_made, field_goals_attempted,
-                            three_pointers_made, three_pointers_attempted,
-                            free_throws_made, free_throws_attempted,
-                            rebounds, assists, steals, blocks,
-                            turnovers, personal_fouls, plus_minus,
-                            game_data
-                        FROM player_game_logs
-                        WHERE LOWER(player_name) = LOWER(%s)
-                        ORDER BY game_date DESC, id DESC
-                        LIMIT %s
-                    """, (player_name, limit))
-                else:
-                    cursor.execute("""
-                        SELECT 
-                            player_id, player_name, game_date, matchup,
-                            points, minutes_played, start_position, starter_status,
-                            field_goals_made, field_goals_attempted,
-                            three_pointers_made, three_pointers_attempted,
-                            free_throws_made, free_throws_attempted,
-                            rebounds, assists, steals, blocks,
-                            turnovers, personal_fouls, plus_minus,
-                            game_data
-                        FROM player_game_logs
-                        WHERE LOWER(player_name) = LOWER(%s)
-                        ORDER BY game_date DESC, id DESC
-                    """, (player_name,))
-
-                rows = cursor.fetchall()
-
-                results = []
-                for row in rows:
-                    game_data = json.loads(row['game_data']) if row.get('game_data') else None
-                    start_position = row.get('start_position')
-                    starter_status = row.get('starter_status')
-
+            with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(_SELECT_PLAYER_GAME_LOGS_BY_NAME, (player_name, limit or _NO_LIMIT))
+                
+                for values in cursor:
+                    row = dict(zip(_GAME_LOG_COLUMNS, values))
+                    game_data = _loads_game_data(row['game_data']) if row['game_data'] else None
+                    start_position = row['start_position']
+                    starter_status = row['starter_status']
+                    
                     if not start_position and not starter_status and isinstance(game_data, dict):
                         if 'START_POSITION' in game_data:
                             start_position = game_data.get('START_POSITION') or None
                         if 'START_POSITION' in game_data and not starter_status:
                             starter_status = 'STARTER' if start_position else starter_status
-
-                    results.append({
-                        'player_id': row['player_id'],
-                        'player_name': row['player_name'],
-                        'game_date': str(row['game_date']) if row.get('game_date') else None,
-                        'matchup': row.get('matchup'),
-                        'points': row.get('points'),
-                        'minutes_played': row.get('minutes_played'),
-                        'start_position': start_position,
-                        'starter_status': starter_status,
-                        'field_goals_made': row.get('field_goals_made'),
-                        'field_goals_attempted': row.get('field_goals_attempted'),
-                        'three_pointers_made': row.get('three_pointers_made'),
-                        'three_pointers_attempted': row.get('three_pointers_attempted'),
-                        'free_throws_made': row.get('free_throws_made'),
-                        'free_throws_attempted': row.get('free_throws_attempted'),
-                        'rebounds': row.get('rebounds'),
-                        'assists': row.get('assists'),
-                        'steals': row.get('steals'),
-                        'blocks': row.get('blocks'),
-                        'turnovers': row.get('turnovers'),
-                        'personal_fouls': row.get('personal_fouls'),
-                        'plus_minus': row.get('plus_minus'),
-                        'game_data': game_data
-                    })
-
-                return results
+                    
+                    row['game_date'] = str(row['game_date']) if row['game_date'] else None
+                    row['start_position'] = start_position
+                    row['starter_status'] = starter_status
+                    row['game_data'] = game_data
+                    yield row
 
     def get_latest_game_date(self, player_id: int) -> Optional[datetime]:
         """
@@ -550,20 +766,23 @@ class GameLogRepository:
                                               dates: List[str]) -> int:
         """
         Backfill lineup info for existing game logs for given dates.
+        
+        Lineups are matched by player id, falling back to the player name
+        for dates without a lineup row for the id; each is a single
+        UPDATE ... JOIN over all dates.
+        
+        Returns:
+            Number of game logs updated
         """
-        updated = 0
-        for date in dates:
-            lineup_info = self.get_lineup_info_for_player_date(player_id, date)
-            if not lineup_info and player_name:
-                lineup_info = self.get_lineup_info_for_player_name_date(player_name, date)
-            if not lineup_info:
-                continue
-            self.update_game_log_lineup_info(
-                player_id=player_id,
-                game_date=date,
-                start_position=lineup_info.get('start_position'),
-                starter_status=lineup_info.get('starter_status')
-            )
-            updated += 1
+        if not dates:
+            return 0
+        dates = tuple(dates)
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                updated = cursor.execute(_BACKFILL_LINEUP_INFO_BY_ID, (player_id, dates))
+                if player_name:
+                    updated += cursor.execute(
+                        _BACKFILL_LINEUP_INFO_BY_NAME, (player_name.strip(), player_id, dates)
+                    )
+                conn.commit()
         return updated
-
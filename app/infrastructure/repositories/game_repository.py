@@ -1,16 +1,141 @@
 """
 Game repository for MySQL operations.
 """
+from itertools import product
 from typing import List, Optional, Dict, Any
 import logging
 
 from app.domain.models.game import Game
 from app.domain.value_objects.game_id import GameId
+from app.infrastructure.cache.cache_provider import CacheProvider
 from app.infrastructure.database.connection import DatabaseConnection
 from app.config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Insert-or-update of a scheduled game. executemany() sends a whole batch of
+# these as one multi-row INSERT (PyMySQL rewrites the VALUES clause and
+# splits the statement if it would exceed its maximum length)
+_UPSERT_GAME = """
+    INSERT INTO games (
+        game_id, home_team, away_team, game_date, game_time,
+        status, season, season_type, home_team_name, away_team_name,
+        home_team_logo_url, away_team_logo_url
+    ) VALUES (
+        %(game_id)s, %(home_team)s, %(away_team)s, %(game_date)s, %(game_time)s,
+        %(status)s, %(season)s, %(season_type)s, %(home_team_name)s, %(away_team_name)s,
+        %(home_team_logo_url)s, %(away_team_logo_url)s
+    )
+    ON DUPLICATE KEY UPDATE
+        home_team = VALUES(home_team),
+        away_team = VALUES(away_team),
+        game_date = VALUES(game_date),
+        game_time = VALUES(game_time),
+        status = VALUES(status),
+        season = VALUES(season),
+        season_type = VALUES(season_type),
+        home_team_name = VALUES(home_team_name),
+        away_team_name = VALUES(away_team_name),
+        home_team_logo_url = VALUES(home_team_logo_url),
+        away_team_logo_url = VALUES(away_team_logo_url),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Columns returned by the game readers
+_GAME_COLUMNS = (
+    'game_id', 'home_team', 'away_team', 'game_date', 'game_time',
+    'status', 'season', 'season_type', 'home_team_name', 'away_team_name',
+    'home_team_logo_url', 'away_team_logo_url',
+    'home_score', 'away_score', 'score_last_update', 'game_completed',
+)
+_GAME_SELECT_LIST = ', '.join(_GAME_COLUMNS)
+
+_SELECT_GAMES_BY_DATE = f"""
+    SELECT {_GAME_SELECT_LIST}
+    FROM games
+    WHERE game_date = %s
+    ORDER BY game_time ASC
+"""
+_SELECT_GAME_BY_ID = f"""
+    SELECT {_GAME_SELECT_LIST}
+    FROM games
+    WHERE game_id = %s
+"""
+
+
+def _update_game_scores_sql(with_home: bool, with_away: bool, completed: bool,
+                            with_last_update: bool) -> str:
+    """Build the UPDATE statement for one combination of score fields."""
+    updates = []
+    if with_home:
+        updates.append("home_score = %s")
+    if with_away:
+        updates.append("away_score = %s")
+    updates.append("game_completed = %s")
+    # Mark as finished when completed
+    if completed:
+        updates.append("status = 'Finished'")
+    if with_last_update:
+        updates.append("score_last_update = %s")
+    return f"""
+        UPDATE games
+        SET {', '.join(updates)}, updated_at = CURRENT_TIMESTAMP
+        WHERE game_id = %s
+    """
+
+
+# update_game_scores statements for every combination of
+# (home_score, away_score, completed, last_update) being set
+_UPDATE_GAME_SCORES = {
+    flags: _update_game_scores_sql(*flags)
+    for flags in product((False, True), repeat=4)
+}
+
+
+def _to_mysql_datetime(value: Any) -> Any:
+    """
+    Convert an ISO 8601 timestamp (e.g. '2026-01-14T04:25:21Z') to MySQL
+    DATETIME format; MySQL doesn't accept the 'Z' timezone indicator.
+    Other values are returned as-is.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.endswith('Z'):
+        value = value[:-1]
+    return value.replace('T', ' ', 1)
+
+
+# Read cache shared by every GameRepository of the process (controllers
+# create their own repositories). Games that can still change are only
+# reused for a few seconds; completed games (and dates whose games are all
+# completed) for longer. Writes through this repository evict the affected
+# entries of this process only.
+_GAME_CACHE = CacheProvider()
+_LIVE_GAME_TTL_SECONDS = 5
+_SETTLED_GAME_TTL_SECONDS = 300
+_GAMES_BY_DATE_PREFIX = "games:date:"
+
+
+def _game_key(game_id: str) -> str:
+    """Cache key of a single game."""
+    return f"game:{game_id}"
+
+
+def _is_settled(game: Dict[str, Any]) -> bool:
+    """Whether a game is final, so its cached row can be kept longer."""
+    return bool(game.get('game_completed')) or game.get('status') == 'Finished'
+
+
+def _evict_game(game_id: str) -> None:
+    """
+    Drop a game, and every per-date list that may contain it, from the cache.
+    
+    The cache is per process: other workers keep serving their entries
+    until the entries' TTL runs out.
+    """
+    _GAME_CACHE.delete(_game_key(game_id))
+    _GAME_CACHE.delete_prefix(_GAMES_BY_DATE_PREFIX)
+
 
 class GameRepository:
     """
@@ -35,31 +160,9 @@ class GameRepository:
         """
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO games (
-                        game_id, home_team, away_team, game_date, game_time,
-                        status, season, season_type, home_team_name, away_team_name,
-                        home_team_logo_url, away_team_logo_url
-                    ) VALUES (
-                        %(game_id)s, %(home_team)s, %(away_team)s, %(game_date)s, %(game_time)s,
-                        %(status)s, %(season)s, %(season_type)s, %(home_team_name)s, %(away_team_name)s,
-                        %(home_team_logo_url)s, %(away_team_logo_url)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        home_team = VALUES(home_team),
-                        away_team = VALUES(away_team),
-                        game_date = VALUES(game_date),
-                        game_time = VALUES(game_time),
-                        status = VALUES(status),
-                        season = VALUES(season),
-                        season_type = VALUES(season_type),
-                        home_team_name = VALUES(home_team_name),
-                        away_team_name = VALUES(away_team_name),
-                        home_team_logo_url = VALUES(home_team_logo_url),
-                        away_team_logo_url = VALUES(away_team_logo_url),
-                        updated_at = CURRENT_TIMESTAMP
-                """, game_data)
+                cursor.execute(_UPSERT_GAME, game_data)
                 conn.commit()
+        _evict_game(game_data['game_id'])
     
     def get_games_by_date(self, date: str) -> List[Dict[str, Any]]:
         """
@@ -71,19 +174,21 @@ class GameRepository:
         Returns:
             List of game dictionaries
         """
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT 
-                        game_id, home_team, away_team, game_date, game_time,
-                        status, season, season_type, home_team_name, away_team_name,
-                        home_team_logo_url, away_team_logo_url,
-                        home_score, away_score, score_last_update, game_completed
-                    FROM games
-                    WHERE game_date = %s
-                    ORDER BY game_time ASC
-                """, (date,))
-                return cursor.fetchall()
+        key = f"{_GAMES_BY_DATE_PREFIX}{date}"
+        games = _GAME_CACHE.get(key)
+        if games is None:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(_SELECT_GAMES_BY_DATE, (date,))
+                    games = cursor.fetchall()
+            # Decided by the games themselves rather than the calendar: the
+            # server's (UTC) date passes midnight while US evening games
+            # are still being played
+            settled = bool(games) and all(_is_settled(game) for game in games)
+            ttl = _SETTLED_GAME_TTL_SECONDS if settled else _LIVE_GAME_TTL_SECONDS
+            _GAME_CACHE.set(key, games, ttl)
+        # Callers get their own copies to modify
+        return [dict(game) for game in games]
     
     def get_game_by_id(self, game_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -95,18 +200,18 @@ class GameRepository:
         Returns:
             Game dictionary or None if not found
         """
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT 
-                        game_id, home_team, away_team, game_date, game_time,
-                        status, season, season_type, home_team_name, away_team_name,
-                        home_team_logo_url, away_team_logo_url,
-                        home_score, away_score, score_last_update, game_completed
-                    FROM games
-                    WHERE game_id = %s
-                """, (game_id,))
-                return cursor.fetchone()
+        key = _game_key(game_id)
+        game = _GAME_CACHE.get(key)
+        if game is None:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(_SELECT_GAME_BY_ID, (game_id,))
+                    game = cursor.fetchone()
+            if game is None:
+                return None
+            ttl = _SETTLED_GAME_TTL_SECONDS if _is_settled(game) else _LIVE_GAME_TTL_SECONDS
+            _GAME_CACHE.set(key, game, ttl)
+        return dict(game)
 
     def find_game_by_teams(self, home_team: str, away_team: str, date: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -128,11 +233,7 @@ class GameRepository:
                     date_filter = "AND game_date = %s"
                     params.append(date)
                 cursor.execute(f"""
-                    SELECT
-                        game_id, home_team, away_team, game_date, game_time,
-                        status, season, season_type, home_team_name, away_team_name,
-                        home_team_logo_url, away_team_logo_url,
-                        home_score, away_score, score_last_update, game_completed
+                    SELECT {_GAME_SELECT_LIST}
                     FROM games
                     WHERE (
                         (home_team = %s AND away_team = %s)
@@ -156,41 +257,29 @@ class GameRepository:
         if not games_data:
             return 0
         
-        saved_count = 0
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
+                try:
+                    cursor.executemany(_UPSERT_GAME, games_data)
+                    conn.commit()
+                    _GAME_CACHE.clear()
+                    return len(games_data)
+                except Exception as e:
+                    conn.rollback()
+                    logger.warning(f"Batch save of {len(games_data)} games failed, saving one by one: {e}")
+                
+                # Save row by row so one bad game doesn't drop the whole batch
+                saved_count = 0
                 for game_data in games_data:
                     try:
-                        cursor.execute("""
-                            INSERT INTO games (
-                                game_id, home_team, away_team, game_date, game_time,
-                                status, season, season_type, home_team_name, away_team_name,
-                                home_team_logo_url, away_team_logo_url
-                            ) VALUES (
-                                %(game_id)s, %(home_team)s, %(away_team)s, %(game_date)s, %(game_time)s,
-                                %(status)s, %(season)s, %(season_type)s, %(home_team_name)s, %(away_team_name)s,
-                                %(home_team_logo_url)s, %(away_team_logo_url)s
-                            )
-                            ON DUPLICATE KEY UPDATE
-                                home_team = VALUES(home_team),
-                                away_team = VALUES(away_team),
-                                game_date = VALUES(game_date),
-                                game_time = VALUES(game_time),
-                                status = VALUES(status),
-                                season = VALUES(season),
-                                season_type = VALUES(season_type),
-                                home_team_name = VALUES(home_team_name),
-                                away_team_name = VALUES(away_team_name),
-                                home_team_logo_url = VALUES(home_team_logo_url),
-                                away_team_logo_url = VALUES(away_team_logo_url),
-                                updated_at = CURRENT_TIMESTAMP
-                        """, game_data)
+                        cursor.execute(_UPSERT_GAME, game_data)
                         saved_count += 1
                     except Exception as e:
                         logger.error(f"Error saving game {game_data.get('game_id')}: {e}")
                         continue
                 
                 conn.commit()
+                _GAME_CACHE.clear()
                 return saved_count
     
     def update_game_scores(self, game_id: str, home_score: Optional[int] = None, 
@@ -206,64 +295,22 @@ class GameRepository:
             completed: Whether the game is completed
             last_update: Last update timestamp
         """
+        params = []
+        if home_score is not None:
+            params.append(home_score)
+        if away_score is not None:
+            params.append(away_score)
+        # Always update completed status
+        params.append(1 if completed else 0)
+        if last_update:
+            params.append(_to_mysql_datetime(last_update))
+        params.append(game_id)
+        
+        sql = _UPDATE_GAME_SCORES[
+            home_score is not None, away_score is not None, bool(completed), bool(last_update)
+        ]
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
-                updates = []
-                params = []
-                
-                if home_score is not None:
-                    updates.append("home_score = %s")
-                    params.append(home_score)
-                
-                if away_score is not None:
-                    updates.append("away_score = %s")
-                    params.append(away_score)
-                
-                # Always update completed status
-                updates.append("game_completed = %s")
-                params.append(1 if completed else 0)
-
-                # Mark as finished when completed
-                if completed:
-                    updates.append("status = %s")
-                    params.append("Finished")
-                
-                if last_update:
-                    # Convert ISO 8601 format (with Z) to MySQL DATETIME format
-                    # MySQL doesn't accept 'Z' timezone indicator, so we need to convert it
-                    try:
-                        from datetime import datetime
-                        # Parse ISO 8601 format (e.g., '2026-01-14T04:25:21Z')
-                        if isinstance(last_update, str):
-                            # Handle ISO 8601 format with 'Z' (UTC)
-                            if last_update.endswith('Z'):
-                                # Remove 'Z' and replace 'T' with space for MySQL DATETIME format
-                                last_update_mysql = last_update[:-1].replace('T', ' ')
-                            elif 'T' in last_update:
-                                # Has 'T' but no 'Z', just replace 'T' with space
-                                last_update_mysql = last_update.replace('T', ' ')
-                            else:
-                                # Already in MySQL format or different format
-                                last_update_mysql = last_update
-                        else:
-                            last_update_mysql = last_update
-                    except Exception as e:
-                        logger.warning(f"Error parsing last_update datetime '{last_update}': {e}, using as-is")
-                        # Try simple string replacement as fallback
-                        if isinstance(last_update, str):
-                            last_update_mysql = last_update.replace('Z', '').replace('T', ' ')
-                        else:
-                            last_update_mysql = last_update
-                    
-                    updates.append("score_last_update = %s")
-                    params.append(last_update_mysql)
-                
-                if updates:
-                    params.append(game_id)
-                    cursor.execute(f"""
-                        UPDATE games
-                        SET {', '.join(updates)}, updated_at = CURRENT_TIMESTAMP
-                        WHERE game_id = %s
-                    """, params)
-                    conn.commit()
-
+                cursor.execute(sql, params)
+                conn.commit()
+        _evict_game(game_id)
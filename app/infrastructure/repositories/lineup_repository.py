@@ -10,6 +10,22 @@ from app.domain.value_objects.player_photos import get_player_photo_url
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _loads(data: str) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _loads(data: str) -> Any:
+        return json.loads(data)
+
 
 class LineupRepository:
     """
@@ -51,11 +67,12 @@ class LineupRepository:
                 cursor.execute("""
                     INSERT INTO game_lineups (
                         game_id, lineup_date, team_abbr, position,
-                        player_id, player_name, player_photo_url, confirmed, player_status, points_line
+                        player_id, player_name, player_photo_url, confirmed, player_status
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                     ON DUPLICATE KEY UPDATE
+                        id = LAST_INSERT_ID(id),
                         player_id = VALUES(player_id),
                         player_name = VALUES(player_name),
                         player_photo_url = VALUES(player_photo_url),
@@ -66,10 +83,17 @@ class LineupRepository:
                             WHEN player_status = 'STARTER' THEN 'STARTER'
                             ELSE VALUES(player_status)
                         END,
-                        points_line = COALESCE(VALUES(points_line), points_line),
                         updated_at = CURRENT_TIMESTAMP
                 """, (game_id, lineup_date, team_abbr, position, 
-                      player_id, player_name, player_photo_url, 1 if confirmed else 0, player_status, points_line))
+                      player_id, player_name, player_photo_url, 1 if confirmed else 0, player_status))
+                
+                if points_line is not None:
+                    cursor.execute("""
+                        INSERT INTO lineup_odds (lineup_id, points_line)
+                        VALUES (%s, %s)
+                        ON DUPLICATE KEY UPDATE
+                            points_line = VALUES(points_line)
+                    """, (cursor.lastrowid, points_line))
                 conn.commit()
     
     def update_points_line_for_player(self, game_id: str, lineup_date: str, 
@@ -92,51 +116,40 @@ class LineupRepository:
             rebounds_line: Rebounds line from odds (optional)
             over_under_history: OVER/UNDER history dictionary (optional)
         """
-        import json
+        # Odds live in lineup_odds, keyed by the lineup row; the lineup row is
+        # looked up in the same statement and the odds row created on demand
+        if over_under_history is not None:
+            history_sql = "%s"
+            history_update = "over_under_history = VALUES(over_under_history),"
+            params = (points_line, assists_line, rebounds_line, _dumps(over_under_history))
+        elif clear_over_under_history:
+            history_sql = "NULL"
+            history_update = "over_under_history = NULL,"
+            params = (points_line, assists_line, rebounds_line)
+        else:
+            history_sql = "NULL"
+            history_update = ""
+            params = (points_line, assists_line, rebounds_line)
+        
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
-                if over_under_history is not None:
-                    over_under_json = json.dumps(over_under_history)
-                    cursor.execute("""
-                        UPDATE game_lineups
-                        SET points_line = %s,
-                            assists_line = %s,
-                            rebounds_line = %s,
-                            over_under_history = %s,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE game_id = %s
-                          AND lineup_date = %s
-                          AND team_abbr = %s
-                          AND player_id = %s
-                    """, (points_line, assists_line, rebounds_line, over_under_json, 
-                          game_id, lineup_date, team_abbr, player_id))
-                elif clear_over_under_history:
-                    cursor.execute("""
-                        UPDATE game_lineups
-                        SET points_line = %s,
-                            assists_line = %s,
-                            rebounds_line = %s,
-                            over_under_history = NULL,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE game_id = %s
-                          AND lineup_date = %s
-                          AND team_abbr = %s
-                          AND player_id = %s
-                    """, (points_line, assists_line, rebounds_line, 
-                          game_id, lineup_date, team_abbr, player_id))
-                else:
-                    cursor.execute("""
-                        UPDATE game_lineups
-                        SET points_line = %s,
-                            assists_line = %s,
-                            rebounds_line = %s,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE game_id = %s
-                          AND lineup_date = %s
-                          AND team_abbr = %s
-                          AND player_id = %s
-                    """, (points_line, assists_line, rebounds_line, 
-                          game_id, lineup_date, team_abbr, player_id))
+                cursor.execute(f"""
+                    INSERT INTO lineup_odds (
+                        lineup_id, points_line, assists_line, rebounds_line, over_under_history
+                    )
+                    SELECT id, %s, %s, %s, {history_sql}
+                    FROM game_lineups
+                    WHERE game_id = %s
+                      AND lineup_date = %s
+                      AND team_abbr = %s
+                      AND player_id = %s
+                    ON DUPLICATE KEY UPDATE
+                        points_line = VALUES(points_line),
+                        assists_line = VALUES(assists_line),
+                        rebounds_line = VALUES(rebounds_line),
+                        {history_update}
+                        updated_at = CURRENT_TIMESTAMP
+                """, params + (game_id, lineup_date, team_abbr, player_id))
                 
                 rows_affected = cursor.rowcount
                 if rows_affected == 0:
@@ -292,13 +305,14 @@ class LineupRepository:
                     SELECT 
                         gl.game_id, gl.team_abbr, gl.position,
                         gl.player_id, gl.player_name, gl.player_photo_url, gl.confirmed, gl.player_status,
-                        gl.lineup_date, gl.points_line, gl.assists_line, gl.rebounds_line, gl.over_under_history,
+                        gl.lineup_date, lo.points_line, lo.assists_line, lo.rebounds_line, lo.over_under_history,
                         g.home_team, g.away_team, g.game_date, g.game_time, g.status,
                         g.home_team_name, g.away_team_name,
                         g.home_team_logo_url, g.away_team_logo_url,
                         g.home_score, g.away_score, g.score_last_update, g.game_completed
                     FROM game_lineups gl
                     JOIN games g ON gl.game_id = g.game_id
+                    LEFT JOIN lineup_odds lo ON lo.lineup_id = gl.id
                     WHERE gl.lineup_date = %s
                     ORDER BY gl.game_id, gl.team_abbr, gl.position
                 """, (date,))
@@ -346,7 +360,7 @@ class LineupRepository:
                     if row.get('over_under_history'):
                         try:
                             if isinstance(row['over_under_history'], str):
-                                over_under_history = json.loads(row['over_under_history'])
+                                over_under_history = _loads(row['over_under_history'])
                             else:
                                 # Already a dict (MySQL JSON type returns dict)
                                 over_under_history = row['over_under_history']
@@ -394,7 +408,7 @@ class LineupRepository:
                     SELECT 
                         gl.game_id, gl.team_abbr, gl.position,
                         gl.player_id, gl.player_name, gl.player_photo_url, gl.confirmed, gl.player_status,
-                        gl.lineup_date, gl.points_line, gl.assists_line, gl.rebounds_line, gl.over_under_history,
+                        gl.lineup_date, lo.points_line, lo.assists_line, lo.rebounds_line, lo.over_under_history,
                         g.home_team, g.away_team,
                         g.home_team_name, g.away_team_name,
                         g.home_team_logo_url, g.away_team_logo_url,
@@ -402,6 +416,7 @@ class LineupRepository:
                         g.home_score, g.away_score, g.score_last_update, g.game_completed
                     FROM game_lineups gl
                     JOIN games g ON gl.game_id = g.game_id
+                    LEFT JOIN lineup_odds lo ON lo.lineup_id = gl.id
                     WHERE gl.game_id = %s
                     ORDER BY gl.team_abbr, gl.position
                 """, (game_id,))
@@ -450,7 +465,7 @@ class LineupRepository:
                     if row.get('over_under_history'):
                         try:
                             if isinstance(row['over_under_history'], str):
-                                over_under_history = json.loads(row['over_under_history'])
+                                over_under_history = _loads(row['over_under_history'])
                             else:
                                 # Already a dict (MySQL JSON type returns dict)
                                 over_under_history = row['over_under_history']
@@ -543,32 +558,41 @@ class LineupRepository:
         # Use composite position to ensure uniqueness for BENCH players
         position = f'BENCH-{player_id}'
         
-        over_under_json = json.dumps(over_under_history) if over_under_history else None
+        over_under_json = _dumps(over_under_history) if over_under_history else None
         
         with self.db.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO game_lineups (
                         game_id, lineup_date, team_abbr, position,
-                        player_id, player_name, player_photo_url, confirmed, player_status, 
-                        points_line, assists_line, rebounds_line, over_under_history
+                        player_id, player_name, player_photo_url, confirmed, player_status
                     ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                     ON DUPLICATE KEY UPDATE
+                        id = LAST_INSERT_ID(id),
                         player_id = VALUES(player_id),
                         player_name = VALUES(player_name),
                         player_photo_url = VALUES(player_photo_url),
                         confirmed = 0,
                         player_status = 'BENCH',
+                        updated_at = CURRENT_TIMESTAMP
+                """, (game_id, lineup_date, team_abbr, position, 
+                      player_id, player_name, player_photo_url, 0, 'BENCH'))
+                
+                cursor.execute("""
+                    INSERT INTO lineup_odds (
+                        lineup_id, points_line, assists_line, rebounds_line, over_under_history
+                    ) VALUES (
+                        %s, %s, %s, %s, %s
+                    )
+                    ON DUPLICATE KEY UPDATE
                         points_line = VALUES(points_line),
                         assists_line = VALUES(assists_line),
                         rebounds_line = VALUES(rebounds_line),
                         over_under_history = VALUES(over_under_history),
                         updated_at = CURRENT_TIMESTAMP
-                """, (game_id, lineup_date, team_abbr, position, 
-                      player_id, player_name, player_photo_url, 0, 'BENCH', 
-                      points_line, assists_line, rebounds_line, over_under_json))
+                """, (cursor.lastrowid, points_line, assists_line, rebounds_line, over_under_json))
                 conn.commit()
     
     def save_depth_chart(self, team_abbr: str, season: int, depth_chart: Dict[str, List[Dict[str, Any]]]) -> int:
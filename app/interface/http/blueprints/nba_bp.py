@@ -1,6 +1,7 @@
 """
 NBA endpoints blueprint.
 """
+import atexit
 from flask import Blueprint, request, jsonify
 import requests
 
@@ -35,7 +36,12 @@ lineup_repository = LineupRepository(db_connection)
 odds_history_repository = OddsHistoryRepository(db_connection)
 # Initialize clients to consume microservices
 fantasynerds_client = FantasyNerdsClient(config.FANTASYNERDS_SERVICE_URL)
-odds_api_client = OddsAPIClient(config.ODDS_API_SERVICE_URL)
+odds_api_client = OddsAPIClient(
+    config.ODDS_API_SERVICE_URL,
+    events_cache_ttl_seconds=config.ODDS_EVENTS_CACHE_TTL_SECONDS,
+    odds_cache_ttl_seconds=config.ODDS_CACHE_TTL_SECONDS
+)
+atexit.register(odds_api_client.close)
 
 # Initialize NBA API client (now consumes microservice)
 nba_client = None
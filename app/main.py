@@ -1,10 +1,48 @@
 """
 Flask application factory.
 """
+import logging
+from typing import List
+
+import pymysql
 from flask import Flask
 
 from app.config.settings import Config
 
+logger = logging.getLogger(__name__)
+
+# Client errors meaning the database server can't be reached (yet):
+# CR_CONNECTION_ERROR, CR_CONN_HOST_ERROR, CR_SERVER_GONE_ERROR and
+# CR_SERVER_LOST. Other OperationalErrors (e.g. a rejected ALTER) are
+# schema failures.
+_CONNECTION_ERRORS = (2002, 2003, 2006, 2013)
+
+
+def _init_database(config_class, errors: List[Exception]) -> None:
+    """
+    Create database tables.
+    
+    A database that can't be reached yet is logged and tolerated so the app
+    still starts; any other failure is appended to ``errors`` and re-raised
+    by create_app.
+    
+    Args:
+        config_class: Configuration class to use
+        errors: Collects schema setup failures for the calling thread
+    """
+    try:
+        from app.infrastructure.database.migrations import create_tables
+        create_tables(config_class)
+    except pymysql.err.OperationalError as e:
+        if e.args and e.args[0] in _CONNECTION_ERRORS:
+            logger.exception("Could not connect to the database to initialize tables")
+        else:
+            logger.exception("Database schema setup failed")
+            errors.append(e)
+    except Exception as e:
+        logger.exception("Database schema setup failed")
+        errors.append(e)
+
 
 def create_app(config_class=Config) -> Flask:
     """
@@ -24,6 +62,16 @@ def create_app(config_class=Config) -> Flask:
     app = Flask(__name__, static_folder=static_folder, static_url_path='/static')
     app.config.from_object(config_class)
     
+    # Initialize database tables on startup. The migration is bound by
+    # database round trips, so it runs in a background thread while the
+    # blueprints (and their nba_api/pandas imports) are loaded below
+    import threading
+    db_init_errors: List[Exception] = []
+    db_init = threading.Thread(
+        target=_init_database, args=(config_class, db_init_errors), name='create-tables', daemon=True
+    )
+    db_init.start()
+    
     # Enable CORS for all routes
     from flask_cors import CORS
     CORS(app, resources={r"/*": {"origins": "*"}})
@@ -41,18 +89,14 @@ def create_app(config_class=Config) -> Flask:
         from flask import send_from_directory
         return send_from_directory(static_folder, 'index.html')
     
-    # Initialize database tables on startup
-    try:
-        from app.infrastructure.database.migrations import create_tables
-        create_tables(config_class)
-    except Exception as e:
-        # Log but don't fail startup if DB is not ready yet
-        import logging
-        logging.warning(f"Could not initialize database tables: {e}")
-    
     # Register error handlers
     from app.interface.http.errors.handlers import register_error_handlers
     register_error_handlers(app)
     
+    # Tables must exist before the app starts serving requests
+    db_init.join()
+    if db_init_errors:
+        raise db_init_errors[0]
+    
     return app
 
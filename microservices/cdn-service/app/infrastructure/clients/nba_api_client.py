@@ -38,6 +38,7 @@ class NBAClient:
     def __init__(self):
         """Initialize the client."""
         self._player_id_cache = {}
+        self._ascii_index: Optional[Dict[str, int]] = None
         try:
             from nba_api.stats.endpoints import playergamelog, commonteamroster, commonplayerinfo, boxscoretraditionalv2, scoreboardv2
             from nba_api.stats.library.parameters import SeasonType
@@ -106,12 +107,38 @@ class NBAClient:
             logger.error(f"Error fetching last {n} games: {e}")
             return []
     
+    def _get_ascii_index(self) -> Dict[str, int]:
+        """
+        Build (once) a lowercase name -> player ID index for players whose
+        names contain no accents, so typical lookups skip Unicode normalization.
+        """
+        if self._ascii_index is None:
+            ascii_index = {}
+            for player in self.players.get_players():
+                full_name = player.get('full_name', '')
+                nba_id = player.get('id')
+                if not full_name or not nba_id:
+                    continue
+                if unicodedata.normalize('NFD', full_name) == full_name:
+                    ascii_index.setdefault(full_name.lower().strip(), nba_id)
+            self._ascii_index = ascii_index
+        return self._ascii_index
+    
     def find_nba_player_id_by_name(self, player_name: str) -> Optional[int]:
         """Find NBA official player ID by player name."""
         try:
+            if not player_name or not player_name.strip():
+                return None
+            
             if player_name in self._player_id_cache:
                 return self._player_id_cache[player_name]
             
+            # Fast path: plain names resolve without NFD normalization
+            nba_id = self._get_ascii_index().get(player_name.lower().strip())
+            if nba_id:
+                self._player_id_cache[player_name] = nba_id
+                return nba_id
+            
             all_players = self.players.get_players()
             player_name_normalized = self._normalize_name(player_name)
             
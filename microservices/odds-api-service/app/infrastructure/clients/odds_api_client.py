@@ -4,10 +4,30 @@ The Odds API HTTP client.
 import json
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+_PLAYER_PROP_MARKETS: frozenset = frozenset({'player_points', 'player_assists', 'player_rebounds'})
+_PLAYER_PROP_MARKETS_CSV = 'player_points,player_assists,player_rebounds'
+
+# Raw odds payloads can be hundreds of KB; only the head is logged
+_RAW_LOG_LIMIT_BYTES = 4096
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
 
 class OddsAPIClient:
     """
@@ -24,15 +44,43 @@ class OddsAPIClient:
         """
         self.api_key = api_key
         self.base_url = base_url
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled keep-alive session shared by all requests of this client."""
+        session = requests.Session()
+        # ACCEPT_ENCODING only advertises br/zstd when their decoders are installed
+        session.headers.update({'Accept': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                status=3,
+                backoff_factor=0.4,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                respect_retry_after_header=True,
+                # Hand the final error response back so raise_for_status() reports it
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     @staticmethod
     def _log_request(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> None:
-        try:
-            req = requests.Request(method=method, url=url, params=params or {})
-            prepared = req.prepare()
-            logger.info(f"[ODDS API] RAW REQUEST: {prepared.method} {prepared.url}")
-        except Exception as e:
-            logger.warning(f"[ODDS API] Could not format request URL: {e}")
+        if logger.isEnabledFor(logging.INFO):
+            query = urlencode(params or {})
+            logger.info("[ODDS API] RAW REQUEST: %s %s%s", method, url, f"?{query}" if query else "")
     
     def get_events_for_sport(self, sport: str = "basketball_nba") -> List[Dict[str, Any]]:
         """Get events for a specific sport."""
@@ -40,25 +88,31 @@ class OddsAPIClient:
             url = f"{self.base_url}/v4/sports/{sport}/events"
             params = {'apiKey': self.api_key}
             
-            logger.info(f"[ODDS API] Fetching events for sport: {sport}")
+            logger.info("[ODDS API] Fetching events for sport: %s", sport)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            events = response.json()
-            logger.info(f"[ODDS API] Received {len(events)} events")
+            events = _loads(response.content)
+            logger.info("[ODDS API] Received %d events", len(events))
             return events
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API] Error fetching events: {e}")
+            logger.error("[ODDS API] Error fetching events: %s", e)
             return []
         except Exception as e:
-            logger.error(f"[ODDS API] Unexpected error: {e}")
+            logger.error("[ODDS API] Unexpected error: %s", e)
             return []
     
     def get_player_points_odds(self, event_id: str, regions: str = "us", 
-                              markets: str = "player_points,player_assists,player_rebounds", 
-                              odds_format: str = "american") -> Dict[str, Any]:
-        """Get player props odds for a specific event."""
+                              markets: str = _PLAYER_PROP_MARKETS_CSV, 
+                              odds_format: str = "american",
+                              bookmakers: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get player props odds for a specific event.
+        
+        When ``bookmakers`` is given (comma-separated keys, e.g. "fanduel") the
+        filter is pushed down to The Odds API so other books are never sent.
+        """
         try:
             url = f"{self.base_url}/v4/sports/basketball_nba/events/{event_id}/odds"
             params = {
@@ -67,14 +121,21 @@ class OddsAPIClient:
                 'markets': markets,
                 'oddsFormat': odds_format
             }
+            if bookmakers:
+                params['bookmakers'] = bookmakers
             
-            logger.info(f"[ODDS API] Fetching player props odds for event {event_id}")
+            logger.info("[ODDS API] Fetching player props odds for event %s", event_id)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=30)
+            response = self._session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            event_data = response.json()
-            logger.info(f"[ODDS API] Raw odds response for event {event_id}: {json.dumps(event_data, indent=2, default=str)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[ODDS API] Raw odds response bytes for event %s: %s",
+                    event_id,
+                    response.content[:_RAW_LOG_LIMIT_BYTES].decode('utf-8', 'replace')
+                )
+            event_data = _loads(response.content)
             if not event_data:
                 return {}
             
@@ -82,19 +143,43 @@ class OddsAPIClient:
             if not all_bookmakers:
                 return {}
             
+            # Skip books that were not requested before touching their markets
+            # (the upstream filter should already have removed them)
+            wanted_bookmakers = (
+                frozenset(key.strip() for key in bookmakers.split(',') if key.strip())
+                if bookmakers else None
+            )
+            if wanted_bookmakers is not None and len(wanted_bookmakers) == 1:
+                # Single requested book (e.g. FanDuel): stop scanning at the first match
+                wanted_key = next(iter(wanted_bookmakers))
+                bookmaker = next((b for b in all_bookmakers if b.get('key') == wanted_key), None)
+                if bookmaker is None:
+                    logger.warning("[ODDS API] Bookmaker %s not found for event %s", wanted_key, event_id)
+                    return {}
+                all_bookmakers = [bookmaker]
+            
+            # Fast path: when only prop markets were requested, the upstream response
+            # already contains nothing else, so bookmakers are kept without copying.
+            only_prop_markets = (
+                markets == _PLAYER_PROP_MARKETS_CSV
+                or frozenset(markets.split(',')) <= _PLAYER_PROP_MARKETS
+            )
+            
             # Filter to only player prop markets for each bookmaker
             filtered_bookmakers = []
             for bookmaker in all_bookmakers:
-                markets_list = bookmaker.get('markets', [])
+                if wanted_bookmakers is not None and bookmaker.get('key') not in wanted_bookmakers:
+                    continue
+                if only_prop_markets:
+                    if bookmaker.get('markets'):
+                        filtered_bookmakers.append(bookmaker)
+                    continue
                 player_prop_markets = [
-                    m for m in markets_list
-                    if m.get('key') in ['player_points', 'player_assists', 'player_rebounds']
+                    m for m in bookmaker.get('markets', [])
+                    if m.get('key') in _PLAYER_PROP_MARKETS
                 ]
                 if player_prop_markets:
-                    filtered_bookmakers.append({
-                        **bookmaker,
-                        'markets': player_prop_markets
-                    })
+                    filtered_bookmakers.append(dict(bookmaker, markets=player_prop_markets))
             
             if not filtered_bookmakers:
                 return {}
@@ -109,11 +194,29 @@ class OddsAPIClient:
                 'bookmakers': filtered_bookmakers
             }
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API] Error fetching odds: {e}")
+            logger.error("[ODDS API] Error fetching odds: %s", e)
             return {}
         except Exception as e:
-            logger.error(f"[ODDS API] Unexpected error: {e}")
+            logger.error("[ODDS API] Unexpected error: %s", e)
+            return {}
+    
+    def get_player_points_odds_batch(self, event_ids: List[str], regions: str = "us",
+                                     markets: str = _PLAYER_PROP_MARKETS_CSV,
+                                     odds_format: str = "american",
+                                     bookmakers: Optional[str] = None,
+                                     max_workers: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Get player props odds for several events, fetching them concurrently."""
+        unique_ids = list(dict.fromkeys(event_id for event_id in event_ids if event_id))
+        if not unique_ids:
             return {}
+        
+        workers = max(1, min(max_workers, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda event_id: self.get_player_points_odds(event_id, regions, markets, odds_format, bookmakers),
+                unique_ids
+            )
+            return dict(zip(unique_ids, results))
     
     def get_scores(self, sport: str = "basketball_nba", days_from: int = 1, 
                   event_ids: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -128,17 +231,17 @@ class OddsAPIClient:
             if event_ids:
                 params['eventIds'] = event_ids
             
-            logger.info(f"[ODDS API] Fetching scores for sport: {sport}")
+            logger.info("[ODDS API] Fetching scores for sport: %s", sport)
             self._log_request("GET", url, params)
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            scores = response.json()
-            logger.info(f"[ODDS API] Received {len(scores)} scores")
+            scores = _loads(response.content)
+            logger.info("[ODDS API] Received %d scores", len(scores))
             return scores
         except requests.exceptions.RequestException as e:
-            logger.error(f"[ODDS API] Error fetching scores: {e}")
+            logger.error("[ODDS API] Error fetching scores: %s", e)
             return []
         except Exception as e:
-            logger.error(f"[ODDS API] Unexpected error: {e}")
+            logger.error("[ODDS API] Unexpected error: %s", e)
             return []
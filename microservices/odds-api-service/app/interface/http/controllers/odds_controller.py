@@ -46,8 +46,9 @@ def create_odds_controller(client: OddsAPIClient) -> Blueprint:
             regions = request.args.get('regions', 'us')
             markets = request.args.get('markets', 'player_points,player_assists,player_rebounds')
             odds_format = request.args.get('odds_format', 'american')
+            bookmakers = request.args.get('bookmakers')
             
-            odds = client.get_player_points_odds(event_id, regions, markets, odds_format)
+            odds = client.get_player_points_odds(event_id, regions, markets, odds_format, bookmakers)
             return jsonify({
                 "success": True,
                 "event_id": event_id,
@@ -60,6 +61,36 @@ def create_odds_controller(client: OddsAPIClient) -> Blueprint:
                 "error": str(e)
             }), 500
     
+    @bp.route("/events/odds/batch", methods=["POST"])
+    def get_player_odds_batch():
+        """Get player props odds for several events in one request."""
+        try:
+            payload = request.get_json(silent=True) or {}
+            event_ids = payload.get('event_ids')
+            if not isinstance(event_ids, list):
+                return jsonify({
+                    "success": False,
+                    "error": "event_ids must be a list"
+                }), 400
+            
+            odds = client.get_player_points_odds_batch(
+                event_ids,
+                payload.get('regions', 'us'),
+                payload.get('markets', 'player_points,player_assists,player_rebounds'),
+                payload.get('odds_format', 'american'),
+                payload.get('bookmakers')
+            )
+            return jsonify({
+                "success": True,
+                "data": odds
+            })
+        except Exception as e:
+            logger.error(f"Error fetching batch odds: {e}", exc_info=True)
+            return jsonify({
+                "success": False,
+                "error": str(e)
+            }), 500
+    
     @bp.route("/scores", methods=["GET"])
     def get_scores():
         """Get scores for games."""
@@ -1,6 +1,8 @@
 """
 Flask application factory for Odds API microservice.
 """
+import atexit
+
 from flask import Flask
 from flask_cors import CORS
 
@@ -25,6 +27,7 @@ def create_app(config_class=Config) -> Flask:
         api_key=config_class.THE_ODDS_API_KEY,
         base_url=config_class.THE_ODDS_API_BASE_URL
     )
+    atexit.register(odds_client.close)
     
     # Register blueprints
     odds_bp = create_odds_controller(odds_client)
@@ -0,0 +1,22 @@
+"""
+Partition maintenance script for player_odds_history.
+Run this monthly (e.g. from cron) so upcoming months get their own partition.
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.settings import Config
+from app.infrastructure.database.migrations import extend_odds_partitions
+
+if __name__ == "__main__":
+    print("Extending player_odds_history partitions...")
+    config = Config()
+    try:
+        extend_odds_partitions(config)
+        print("Partitions are up to date!")
+    except Exception as e:
+        print(f"Error extending partitions: {e}")
+        sys.exit(1)
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.config.settings import Config
 from app.infrastructure.database.connection import DatabaseConnection
-from app.infrastructure.database.migrations import create_tables
+from app.infrastructure.database.migrations import create_tables, finalize_indexes
 from app.infrastructure.repositories.game_repository import GameRepository
 from app.application.services.schedule_service import ScheduleService
 
@@ -39,18 +39,25 @@ def reset_and_import(schedule_file: str = None):
                 
                 # Drop tables in reverse order of dependencies
                 logger.info("Dropping existing tables...")
+                cursor.execute("DROP TABLE IF EXISTS lineup_odds")
+                logger.info("  ✓ Dropped lineup_odds table")
+                
                 cursor.execute("DROP TABLE IF EXISTS game_lineups")
                 logger.info("  ✓ Dropped game_lineups table")
                 
                 cursor.execute("DROP TABLE IF EXISTS games")
                 logger.info("  ✓ Dropped games table")
                 
+                # Forget the applied schema version so create_tables rebuilds everything
+                cursor.execute("DROP TABLE IF EXISTS schema_version")
+                logger.info("  ✓ Dropped schema_version table")
+                
                 conn.commit()
                 logger.info("All tables dropped successfully\n")
                 
-                # Recreate tables
+                # Recreate tables; secondary indexes are built after the import
                 logger.info("Creating tables from scratch...")
-                create_tables(config)
+                create_tables(config, with_indexes=False)
                 logger.info("  ✓ Tables created successfully\n")
                 
                 # Import schedule if file provided
@@ -83,6 +90,10 @@ def reset_and_import(schedule_file: str = None):
                 else:
                     logger.info("No schedule file provided. Database is ready for manual import.")
                 
+                logger.info("Creating secondary indexes...")
+                finalize_indexes(config)
+                logger.info("  ✓ Indexes created successfully")
+                
                 logger.info("")
                 logger.info("=" * 60)
                 logger.info("DATABASE RESET COMPLETED!")
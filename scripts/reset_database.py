@@ -30,6 +30,9 @@ def reset_database():
                 cursor.execute("DROP TABLE IF EXISTS player_game_logs")
                 logger.info("  - Dropped player_game_logs table")
                 
+                cursor.execute("DROP TABLE IF EXISTS lineup_odds")
+                logger.info("  - Dropped lineup_odds table")
+                
                 cursor.execute("DROP TABLE IF EXISTS game_lineups")
                 logger.info("  - Dropped game_lineups table")
                 
@@ -39,6 +42,10 @@ def reset_database():
                 cursor.execute("DROP TABLE IF EXISTS games")
                 logger.info("  - Dropped games table")
                 
+                # Forget the applied schema version so create_tables rebuilds everything
+                cursor.execute("DROP TABLE IF EXISTS schema_version")
+                logger.info("  - Dropped schema_version table")
+                
                 conn.commit()
                 logger.info("All tables dropped successfully")
                 
@@ -0,0 +1,83 @@
+"""
+Shared fixtures: a fake database that records the statements sent to it.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+
+class FakeCursor:
+    """Cursor that records statements and serves the given rows."""
+
+    def __init__(self, rows=(), lastrowid=0, rowcount=0):
+        self.rows = list(rows)
+        self.lastrowid = lastrowid
+        self.rowcount = rowcount
+        self.statements = []
+        self.batches = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def execute(self, statement, params=None):
+        self.statements.append((" ".join(statement.split()), params))
+        return self.rowcount
+
+    def executemany(self, statement, rows):
+        self.batches.append((statement, list(rows)))
+        return len(rows)
+
+    def nextset(self):
+        return None
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    """Connection that hands out one cursor and counts commits and rollbacks."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, *args):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeDatabaseConnection:
+    """DatabaseConnection stand-in whose connections share one fake cursor."""
+
+    def __init__(self, cursor):
+        self.connection = FakeConnection(cursor)
+
+    @contextmanager
+    def get_connection(self):
+        yield self.connection
+
+
+@pytest.fixture
+def cursor() -> FakeCursor:
+    return FakeCursor()
+
+
+@pytest.fixture
+def db(cursor) -> FakeDatabaseConnection:
+    """Create a fake database whose connections hand out the fake cursor."""
+    return FakeDatabaseConnection(cursor)
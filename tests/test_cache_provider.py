@@ -0,0 +1,98 @@
+"""
+Tests for the in-memory cache provider and the game read cache.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.infrastructure.cache import cache_provider
+from app.infrastructure.cache.cache_provider import CacheProvider
+from app.infrastructure.repositories import game_repository
+
+
+class FakeClock(datetime):
+    """datetime whose now() only moves when a test advances it."""
+
+    current = datetime(2024, 1, 1, 12, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the time seen by the cache provider."""
+    monkeypatch.setattr(FakeClock, "current", datetime(2024, 1, 1, 12, 0, 0))
+    monkeypatch.setattr(cache_provider, "datetime", FakeClock)
+    return FakeClock
+
+
+def test_set_evicts_least_recently_used(clock):
+    """Test that a full cache drops the entry used least recently."""
+    cache = CacheProvider(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_sweeps_expired_entries_before_evicting(clock):
+    """Test that expired entries make room before live ones are evicted."""
+    cache = CacheProvider(maxsize=2)
+    cache.set("short", 1, ttl_seconds=5)
+    cache.set("long", 2, ttl_seconds=60)
+    clock.current += timedelta(seconds=10)
+
+    cache.set("new", 3)
+
+    assert cache.get("long") == 2
+    assert cache.get("new") == 3
+
+
+def test_get_expires_entries(clock):
+    """Test that an entry is served until its TTL runs out, and not after."""
+    cache = CacheProvider(default_ttl_seconds=30)
+    cache.set("key", "value")
+
+    clock.current += timedelta(seconds=30)
+    assert cache.get("key") == "value"
+
+    clock.current += timedelta(seconds=1)
+    assert cache.get("key") is None
+
+
+def test_delete_prefix(clock):
+    """Test that only keys starting with the prefix are deleted."""
+    cache = CacheProvider()
+    cache.set("odds:1:us", 1)
+    cache.set("odds:2:us", 2)
+    cache.set("events:nba", 3)
+
+    cache.delete_prefix("odds:1:")
+
+    assert cache.get("odds:1:us") is None
+    assert cache.get("odds:2:us") == 2
+    assert cache.get("events:nba") == 3
+
+
+def test_evict_game_drops_game_and_date_lists(clock, monkeypatch):
+    """Test that evicting a game also drops every cached per-date game list."""
+    cache = CacheProvider()
+    monkeypatch.setattr(game_repository, "_GAME_CACHE", cache)
+    cache.set(game_repository._game_key("001"), {"game_id": "001"})
+    cache.set(game_repository._game_key("002"), {"game_id": "002"})
+    cache.set(f"{game_repository._GAMES_BY_DATE_PREFIX}2024-01-01", [{"game_id": "001"}])
+    cache.set(f"{game_repository._GAMES_BY_DATE_PREFIX}2024-01-02", [{"game_id": "003"}])
+
+    game_repository._evict_game("001")
+
+    assert cache.get(game_repository._game_key("001")) is None
+    assert cache.get(game_repository._game_key("002")) == {"game_id": "002"}
+    assert cache.get(f"{game_repository._GAMES_BY_DATE_PREFIX}2024-01-01") is None
+    assert cache.get(f"{game_repository._GAMES_BY_DATE_PREFIX}2024-01-02") is None
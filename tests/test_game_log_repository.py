@@ -0,0 +1,150 @@
+"""
+Tests for the player game log repository.
+"""
+from datetime import date
+
+import pytest
+
+from app.infrastructure.repositories import game_log_repository
+from app.infrastructure.repositories.game_log_repository import GameLogRepository
+
+
+@pytest.mark.parametrize("game_date_str, expected", [
+    ("2024-01-05", date(2024, 1, 5)),
+    ("2024-01-05T00:00:00", date(2024, 1, 5)),
+    ("JAN 05, 2024", date(2024, 1, 5)),
+    ("Jan 5 2024", date(2024, 1, 5)),
+    ("01/05/2024", date(2024, 1, 5)),
+    ("1/5/24", date(2024, 1, 5)),
+    ("", None),
+    ("05-01-2024", None),
+    ("13/45/2024", None),
+    ("Foo 5, 2024", None),
+])
+def test_parse_game_date(game_date_str, expected):
+    """Test the NBA API date formats, and that anything else parses to None."""
+    assert game_log_repository._parse_game_date(game_date_str) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("34:30", 34.5),
+    ("0:00", 0.0),
+    ("34", 34.0),
+    ("34.5", 34.5),
+    (30, 30.0),
+    (12.25, 12.25),
+    ("", None),
+    (None, None),
+    ("x:15", None),
+    ("34:", None),
+    ("DNP", None),
+])
+def test_to_minutes(value, expected):
+    """Test "MM:SS" and numeric minutes, and that malformed values give None."""
+    assert game_log_repository._to_minutes(value) == expected
+
+
+def test_save_player_game_logs_rows(db, cursor):
+    """Test the rows upserted in one batch, with lineup info filled in by date."""
+    cursor.rows = [
+        {"lineup_date": date(2024, 1, 7), "position": "BENCH-1", "player_status": None},
+    ]
+    repository = GameLogRepository(db)
+    stats = {
+        "FGM": 9, "FGA": 18, "FG3M": 2, "FG3A": 6, "FTM": 4, "FTA": 5,
+        "REB": 7, "AST": 5, "STL": 1, "BLK": 0, "TOV": 3, "PF": 2, "PLUS_MINUS": -4,
+    }
+    games = [
+        {"GAME_DATE": "JAN 05, 2024", "MATCHUP": "LAL vs. BOS", "PTS": 24, "MIN": "34:30",
+         "START_POSITION": "F", "Game_ID": "0022300500", **stats},
+        {"GAME_DATE": "2024-01-07", "MATCHUP": "LAL @ NYK", "PTS": 11, "MIN": 20, **stats},
+        {"GAME_DATE": "", "MATCHUP": "LAL @ MIA", "PTS": 30, "MIN": "30:00"},
+        {"GAME_DATE": "not a date", "MATCHUP": "LAL @ MIA", "PTS": 30, "MIN": "30:00"},
+    ]
+
+    saved = repository.save_player_game_logs(2544, "LeBron James", games)
+
+    assert saved == 2
+    assert db.connection.commits == 1
+    statement, rows = cursor.batches[0]
+    assert statement is game_log_repository._UPSERT_GAME_LOG
+    assert len(rows) == 2
+    stat_values = tuple(stats[key] for key in game_log_repository._STAT_KEYS)
+
+    first = rows[0]
+    assert first[:8] == (2544, "LeBron James", date(2024, 1, 5), "LAL vs. BOS",
+                         24.0, 34.5, "F", "STARTER")
+    assert first[8:21] == stat_values
+    assert game_log_repository._loads_game_data(first[21]) == {"START_POSITION": "F", "Game_ID": "0022300500"}
+    assert first[22] == game_log_repository._fingerprint(first[21])
+
+    second = rows[1]
+    assert second[:8] == (2544, "LeBron James", date(2024, 1, 7), "LAL @ NYK",
+                          11.0, 20.0, None, "BENCH")
+    assert game_log_repository._loads_game_data(second[21]) == {}
+    assert all(len(row) == game_log_repository._UPSERT_GAME_LOG.count("%s") for row in rows)
+
+
+def test_save_player_game_logs_skips_rows_that_do_not_fit(db, cursor):
+    """Test that a game with a value out of its column's range is left out of the batch."""
+    repository = GameLogRepository(db)
+    games = [
+        {"GAME_DATE": "2024-01-05", "MATCHUP": "LAL vs. BOS", "PTS": 24, "MIN": "34:30", "REB": 7},
+        {"GAME_DATE": "2024-01-07", "MATCHUP": "LAL @ NYK", "PTS": 11, "MIN": 20, "REB": 300},
+        {"GAME_DATE": "2024-01-09", "MATCHUP": "LAL @ MIA", "PTS": -2, "MIN": 20},
+        {"GAME_DATE": "2024-01-11", "MATCHUP": "LAL @ ORL", "PTS": 8, "MIN": 12, "PLUS_MINUS": -9},
+    ]
+
+    saved = repository.save_player_game_logs(2544, "LeBron James", games)
+
+    assert saved == 2
+    _, rows = cursor.batches[0]
+    assert [row[2] for row in rows] == [date(2024, 1, 5), date(2024, 1, 11)]
+
+
+def test_save_player_game_logs_retries_row_by_row(db, cursor, monkeypatch):
+    """Test that a rejected batch is saved one row at a time, keeping the good rows."""
+    repository = GameLogRepository(db)
+    upserts = []
+
+    def executemany(statement, rows):
+        raise RuntimeError("batch rejected")
+
+    def execute(statement, params=None):
+        if statement is game_log_repository._UPSERT_GAME_LOG:
+            if params[2] == date(2024, 1, 7):
+                raise RuntimeError("row rejected")
+            upserts.append(params[2])
+        return 0
+
+    monkeypatch.setattr(cursor, "executemany", executemany)
+    monkeypatch.setattr(cursor, "execute", execute)
+    games = [
+        {"GAME_DATE": "2024-01-05", "MATCHUP": "LAL vs. BOS", "PTS": 24, "MIN": 34},
+        {"GAME_DATE": "2024-01-07", "MATCHUP": "LAL @ NYK", "PTS": 11, "MIN": 20},
+        {"GAME_DATE": "2024-01-09", "MATCHUP": "LAL @ MIA", "PTS": 30, "MIN": 30},
+    ]
+
+    saved = repository.save_player_game_logs(2544, "LeBron James", games)
+
+    assert saved == 2
+    assert upserts == [date(2024, 1, 5), date(2024, 1, 9)]
+    assert db.connection.commits == 1
+
+
+def test_get_player_game_logs_by_name_leaves_matching_to_collation(db, cursor):
+    """Test that accented rows found by the collation are returned for an un-accented name."""
+    cursor.rows = [
+        (203999, "Nikola Jokić", date(2024, 1, 5), "DEN vs. LAL", 30, 35.5, "C", "STARTER",
+         *([None] * 13), None),
+    ]
+    repository = GameLogRepository(db)
+
+    logs = repository.get_player_game_logs_by_name("nikola jokic", limit=5)
+
+    (statement, params), = cursor.statements
+    where = statement.split("WHERE ")[1].split(" ORDER BY")[0]
+    assert where == "player_name = %s"
+    assert params == ("nikola jokic", 5)
+    assert [log["player_name"] for log in logs] == ["Nikola Jokić"]
+    assert logs[0]["game_date"] == "2024-01-05"
@@ -0,0 +1,95 @@
+"""
+Tests for lineup odds kept in the lineup_odds child table.
+"""
+import logging
+
+import pytest
+
+from app.infrastructure.repositories.lineup_repository import LineupRepository
+
+
+@pytest.fixture
+def cursor(cursor):
+    """Report an affected row and the parent row's id from the shared fake cursor."""
+    cursor.lastrowid = 42
+    cursor.rowcount = 1
+    return cursor
+
+
+@pytest.fixture
+def repository(db) -> LineupRepository:
+    return LineupRepository(db)
+
+
+def test_save_lineup_keys_odds_by_lineup_row(repository, cursor):
+    """Test that the odds row is upserted under the id of the upserted lineup row."""
+    repository.save_lineup_for_game(
+        "0022300500", "2024-01-05", "LAL", "SF", 2544, "LeBron James",
+        player_photo_url="photo.png", points_line=25.5
+    )
+
+    (lineup_sql, _), (odds_sql, odds_params) = cursor.statements
+    assert lineup_sql.startswith("INSERT INTO game_lineups")
+    # Makes lastrowid the existing row's id when the upsert updates it
+    assert "id = LAST_INSERT_ID(id)" in lineup_sql
+    assert odds_sql.startswith("INSERT INTO lineup_odds (lineup_id, points_line)")
+    assert odds_params == (cursor.lastrowid, 25.5)
+
+
+def test_save_lineup_without_points_line_skips_odds(repository, cursor):
+    """Test that no odds row is written without a points line."""
+    repository.save_lineup_for_game(
+        "0022300500", "2024-01-05", "LAL", "SF", 2544, "LeBron James",
+        player_photo_url="photo.png"
+    )
+
+    assert len(cursor.statements) == 1
+
+
+def test_save_bench_player_keys_odds_by_lineup_row(repository, cursor):
+    """Test that a bench player's odds are upserted under the lineup row id."""
+    repository.save_bench_player_for_game(
+        "0022300500", "2024-01-05", "LAL", 1629216, "Gabe Vincent",
+        player_photo_url="photo.png", points_line=6.5, assists_line=2.5
+    )
+
+    (lineup_sql, lineup_params), (odds_sql, odds_params) = cursor.statements
+    assert "id = LAST_INSERT_ID(id)" in lineup_sql
+    assert lineup_params[3] == "BENCH-1629216"
+    assert odds_sql.startswith("INSERT INTO lineup_odds")
+    assert odds_params == (cursor.lastrowid, 6.5, 2.5, None, None)
+
+
+def test_update_points_line_selects_lineup_row(repository, cursor):
+    """Test that the odds upsert takes the lineup id from game_lineups in the same statement."""
+    repository.update_points_line_for_player(
+        "0022300500", "2024-01-05", "LAL", 2544, 25.5, assists_line=7.5, rebounds_line=8.5
+    )
+
+    (statement, params), = cursor.statements
+    assert "INSERT INTO lineup_odds" in statement
+    assert "SELECT id, %s, %s, %s, NULL FROM game_lineups" in statement
+    assert "over_under_history" not in statement.split("ON DUPLICATE KEY UPDATE")[1]
+    assert params == (25.5, 7.5, 8.5, "0022300500", "2024-01-05", "LAL", 2544)
+
+
+def test_update_points_line_clears_history(repository, cursor):
+    """Test that clearing the OVER/UNDER history nulls it on update."""
+    repository.update_points_line_for_player(
+        "0022300500", "2024-01-05", "LAL", 2544, 25.5, clear_over_under_history=True
+    )
+
+    (statement, _), = cursor.statements
+    assert "over_under_history = NULL" in statement
+
+
+def test_update_points_line_warns_without_lineup_row(repository, cursor, caplog):
+    """Test that a missing lineup row is still reported as an UPDATE without effect."""
+    cursor.rowcount = 0
+
+    with caplog.at_level(logging.WARNING):
+        repository.update_points_line_for_player(
+            "0022300500", "2024-01-05", "LAL", 2544, 25.5
+        )
+
+    assert "UPDATE did not affect any rows for player_id=2544" in caplog.text
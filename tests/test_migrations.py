@@ -0,0 +1,133 @@
+"""
+Tests for the database schema migration.
+"""
+import logging
+
+import pymysql
+import pytest
+
+from app.config.settings import Config
+from app.infrastructure.database import migrations
+
+
+@pytest.fixture
+def cursor(cursor, db, monkeypatch):
+    """Route create_tables to the fake database and return its cursor."""
+    monkeypatch.setattr(migrations, "DatabaseConnection", lambda config, multi_statements=False: db)
+    monkeypatch.setattr(migrations, "_SCHEMA_CHECKED", set())
+    return cursor
+
+
+def test_create_tables_on_empty_database(cursor):
+    """Test that a fresh database gets tables, columns, indexes and a version stamp."""
+    migrations.create_tables(Config())
+
+    statements = [statement for statement, _ in cursor.statements]
+    assert any("CREATE TABLE IF NOT EXISTS games" in s for s in statements)
+    assert any(s.startswith("ALTER TABLE player_game_logs") and "ADD INDEX idx_player_date_id" in s
+               for s in statements)
+    assert any(s.startswith("INSERT IGNORE INTO schema_version") for s in statements)
+    assert statements[-1] == migrations._RESTORE_CHECKS
+
+
+def test_create_tables_skips_current_schema(cursor, monkeypatch):
+    """Test that an up-to-date schema is detected without running the migration."""
+    monkeypatch.setattr(cursor, "fetchone", lambda: {"1": 1})
+
+    migrations.create_tables(Config())
+
+    assert len(cursor.statements) == 1
+    assert "schema_version" in cursor.statements[0][0]
+
+
+def test_create_tables_warns_about_deferred_indexes(cursor, caplog):
+    """Test that deferring the indexes leaves the version unstamped and says so."""
+    with caplog.at_level(logging.WARNING):
+        migrations.create_tables(Config(), with_indexes=False)
+
+    statements = [statement for statement, _ in cursor.statements]
+    assert not any("ADD INDEX" in s for s in statements)
+    assert not any(s.startswith("INSERT IGNORE INTO schema_version") for s in statements)
+    assert "deferred until finalize_indexes()" in caplog.text
+
+
+@pytest.fixture
+def rejected_retype(monkeypatch):
+    """Report an INT points column whose conversion the server rejects."""
+    columns = {table: {} for table in migrations._MIGRATED_TABLES}
+    columns["player_game_logs"] = {"points": "int"}
+    monkeypatch.setattr(migrations, "_existing_columns", lambda cursor, tables: columns)
+    alter_table = migrations._alter_table
+
+    def reject_modify(cursor, statement, hints):
+        if "MODIFY COLUMN" in statement:
+            raise pymysql.MySQLError("Out of range value for column 'points'")
+        alter_table(cursor, statement, hints)
+
+    monkeypatch.setattr(migrations, "_alter_table", reject_modify)
+    return columns
+
+
+def test_create_tables_reports_failed_retype_once(cursor, rejected_retype, monkeypatch, caplog):
+    """Test that a rejected column conversion is stamped and reported, not retried every start."""
+    with caplog.at_level(logging.WARNING):
+        migrations.create_tables(Config())
+
+    statements = [statement for statement, _ in cursor.statements]
+    assert any("ADD INDEX idx_player_date_id" in s for s in statements)
+    assert any(s.startswith("INSERT IGNORE INTO schema_version") for s in statements)
+    assert "some columns still have their old types" in caplog.text
+
+    # The next start finds the stamp and skips the migration
+    monkeypatch.setattr(migrations, "_SCHEMA_CHECKED", set())
+    monkeypatch.setattr(cursor, "fetchone", lambda: {"1": 1})
+    cursor.statements.clear()
+    migrations.create_tables(Config())
+    assert len(cursor.statements) == 1
+
+
+def test_finalize_indexes_reports_old_types(cursor, rejected_retype, caplog):
+    """Test that finalize_indexes stamps the version and reports unconverted columns."""
+    with caplog.at_level(logging.WARNING):
+        migrations.finalize_indexes(Config())
+
+    assert any(s.startswith("INSERT IGNORE INTO schema_version") for s, _ in cursor.statements)
+    assert "some columns still have their old types" in caplog.text
+
+
+class RejectingCursor:
+    """Cursor that rejects ALTERs carrying hints with the given MySQL error."""
+
+    def __init__(self, code):
+        self.code = code
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        if "ALGORITHM=" in statement:
+            raise pymysql.err.OperationalError(self.code, "rejected")
+        return 0
+
+
+@pytest.mark.parametrize("code", [1064, 1800, 1845, 1846])
+def test_alter_table_retries_without_unsupported_hints(code):
+    """Test that an ALTER whose hints the server doesn't support is retried without them."""
+    cursor = RejectingCursor(code)
+
+    migrations._alter_table(cursor, "ALTER TABLE games ADD COLUMN x INT", "ALGORITHM=INSTANT")
+
+    assert cursor.statements == [
+        "ALTER TABLE games ADD COLUMN x INT, ALGORITHM=INSTANT",
+        "ALTER TABLE games ADD COLUMN x INT",
+    ]
+
+
+@pytest.mark.parametrize("code", [1264, 1205, 1062])
+def test_alter_table_raises_other_errors_once(code):
+    """Test that data, lock and duplicate key errors are raised without a second ALTER."""
+    cursor = RejectingCursor(code)
+
+    with pytest.raises(pymysql.MySQLError):
+        migrations._alter_table(cursor, "ALTER TABLE games MODIFY COLUMN x TINYINT", "ALGORITHM=COPY")
+
+    assert len(cursor.statements) == 1